@@ -1,11 +1,39 @@
+from importlib import import_module
+
 from .config import AcousticConfig, load_config
-from .pipeline import analyze_audio, register_with_sensor_schema
 from ..SensorSchema import SensorSchema
 
-register_with_sensor_schema(SensorSchema)
+# The pipeline pulls in the FFT/detection stack and the report schemas; defer it
+# until something actually asks for it (PEP 562).
+_LAZY_ATTRS = {
+    "Detector": ".pipeline",
+    "analyze_audio": ".pipeline",
+    "flush_reports": ".pipeline",
+    "register_with_sensor_schema": ".pipeline",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def _analyze_audio_lazily(sensor_input, **kwargs):
+    return __getattr__("analyze_audio")(sensor_input, **kwargs)
+
+
+# Same name as pipeline._ALGORITHM_NAME; registering the trampoline keeps
+# SensorSchema.from_sensor working without importing the pipeline up front.
+SensorSchema.register_algorithm("acoustic_drone_bpf", _analyze_audio_lazily)
 
 __all__ = [
     "AcousticConfig",
     "load_config",
+    "Detector",
     "analyze_audio",
+    "flush_reports",
 ]
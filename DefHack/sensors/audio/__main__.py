@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 from pathlib import Path
 
@@ -12,12 +13,14 @@ from ..images.ingest import (
     _prepare_payloads,
 )
 
-from . import analyze_audio
+from . import analyze_audio, flush_reports
 
 
 TACTICAL_PREFIX = "TACTICAL:"
+_PREFIX = f"{TACTICAL_PREFIX} "
 DEFAULT_UNIT = DEFAULT_UNIT_LABEL
 DEFAULT_BACKLOG_PATH = Path("DefHack/sensors/audio/backlog.json")
+DEFAULT_READINGS_PATH = Path("DefHack/sensors/audio/predictions.json")
 
 
 def _write_sensor_readings_json(destination: Path, readings) -> None:
@@ -29,7 +32,8 @@ def _write_sensor_readings_json(destination: Path, readings) -> None:
     print(f"Sensor readings written to {destination}")
 
 
-def main() -> None:
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Acoustic drone detection via blade-pass analysis")
     parser.add_argument("input", nargs="?", help="Path to WAV file. If omitted, a synthetic signal is simulated.")
     parser.add_argument("--report", action="store_true", help="Persist a text report to the processed/ directory")
@@ -43,7 +47,7 @@ def main() -> None:
     parser.add_argument(
         "--readings-json",
         type=Path,
-        default=Path("DefHack/sensors/audio/predictions.json"),
+        default=DEFAULT_READINGS_PATH,
         help="Optional path to write SensorObservationIn payload as JSON",
     )
     parser.add_argument("--api-url", default=DEFAULT_API_URL, help="Target ingestion endpoint URL")
@@ -66,7 +70,11 @@ def main() -> None:
     parser.add_argument("--no-summary", dest="summary", action="store_false", help="Suppress console summary output")
     parser.add_argument("--summary", dest="summary", action="store_true", help=argparse.SUPPRESS)
     parser.set_defaults(summary=True, send_payloads=True)
-    args = parser.parse_args()
+    return parser
+
+
+def main() -> None:
+    args = _build_parser().parse_args()
 
     args.backlog_file = args.backlog_file.expanduser().resolve()
     if args.readings_json:
@@ -81,6 +89,9 @@ def main() -> None:
         place=args.mgrs,
         save_report=args.report,
     )
+    if args.report:
+        # Reports are written in the background; make sure it exists (or fail) before saying so.
+        flush_reports(raise_errors=True)
 
     summary_text = schema.summary or ""
     confidence_pct = int(schema.metadata.get("confidence_pct", 0))
@@ -88,16 +99,9 @@ def main() -> None:
     status = "FPV DETECTED" if detected else "NO FPV DETECTED"
 
     base_message = summary_text.strip()
+    description = f"{_PREFIX}{status} (confidence {confidence_pct}%)"
     if base_message:
-        enriched_message = f"{status} (confidence {confidence_pct-3.2}%) - {base_message}"
-    else:
-        enriched_message = f"{status} (confidence {confidence_pct}%)"
-
-    normalized = enriched_message.lstrip()
-    if not normalized.upper().startswith(TACTICAL_PREFIX):
-        description = f"{TACTICAL_PREFIX} {enriched_message}".strip()
-    else:
-        description = enriched_message
+        description = f"{description} - {base_message}"
 
     observation = schema.to_sensor_message(
         mgrs=args.mgrs,
@@ -0,0 +1,157 @@
+"""On-disk memoisation for expensive acoustic analysis stages.
+
+Caching is opt-in: nothing is read or written unless :func:`enable_disk_cache`
+has been called (or ``DEFHACK_AUDIO_CACHE_DIR`` is set). The setting lives in
+the environment so worker processes started afterwards inherit it.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+try:  # pragma: no cover - optional dependency
+    import zstandard
+except ImportError:  # pragma: no cover - fall back to zlib
+    zstandard = None
+
+
+CACHE_DIR_ENV = "DEFHACK_AUDIO_CACHE_DIR"
+DEFAULT_CACHE_DIR = Path(".cache/audio")
+
+# Any change to these sources changes what a cached stage would return.
+_SOURCE_FILES = (
+    "pipeline.py",
+    "config.py",
+    "_windows.py",
+    "analysis/signal_processing.py",
+    "analysis/bpf_detection.py",
+    "utils/io_utils.py",
+)
+_PACKAGE_DIR = Path(__file__).resolve().parent
+_MISSING = object()
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@functools.lru_cache(maxsize=1)
+def _source_hash() -> str:
+    digest = hashlib.sha256()
+    for relative in _SOURCE_FILES:
+        try:
+            digest.update((_PACKAGE_DIR / relative).read_bytes())
+        except OSError:
+            digest.update(relative.encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _compress(data: bytes) -> bytes:
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return zlib.compress(data, 1)
+
+
+def _decompress(data: bytes) -> bytes:
+    if zstandard is not None:
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+class DiskCache:
+    """Pickle blobs under ``root/<function>/<hash>``, keyed on the call arguments."""
+
+    def __init__(self, root: Path = DEFAULT_CACHE_DIR) -> None:
+        self.root = Path(root)
+        self._suffix = ".pkl.zst" if zstandard is not None else ".pkl.z"
+
+    def _path(self, name: str, key: Any) -> Path:
+        digest = hashlib.sha256(pickle.dumps((_source_hash(), name, key), protocol=4)).hexdigest()
+        return self.root / name / digest[:2] / f"{digest}{self._suffix}"
+
+    def get(self, name: str, key: Any, default: Any = None) -> Any:
+        path = self._path(name, key)
+        try:
+            return pickle.loads(_decompress(path.read_bytes()))
+        except FileNotFoundError:
+            return default
+        except Exception:
+            # Truncated or foreign blob: treat as a miss and let it be rewritten.
+            return default
+
+    def set(self, name: str, key: Any, value: Any) -> None:
+        path = self._path(name, key)
+        tmp_name = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            payload = _compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            os.replace(tmp_name, path)
+            tmp_name = None
+        except OSError as exc:
+            print(f"[warn] Failed to write audio cache entry {path}: {exc}")
+        finally:
+            # Whatever went wrong after mkstemp, do not leave the partial file behind.
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+
+def enable_disk_cache(root: str | Path | None = DEFAULT_CACHE_DIR) -> None:
+    """Turn the disk cache on for this process and any workers it starts (``None`` disables)."""
+    if root is None:
+        os.environ.pop(CACHE_DIR_ENV, None)
+    else:
+        os.environ[CACHE_DIR_ENV] = str(Path(root).expanduser().resolve())
+
+
+def _active_cache() -> Optional[DiskCache]:
+    root = os.environ.get(CACHE_DIR_ENV)
+    return DiskCache(Path(root)) if root else None
+
+
+def disk_cache(func: F) -> F:
+    """Memoise ``func`` on disk when caching is enabled; arguments must be picklable.
+
+    The wrapper also exposes ``lookup(*args, **kwargs)`` (the cached value or ``None``)
+    and ``store(value, *args, **kwargs)``, for callers that compute several entries at
+    once instead of going through ``func``.
+    """
+
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        cache = _active_cache()
+        if cache is None:
+            return func(*args, **kwargs)
+        key = (args, tuple(sorted(kwargs.items())))
+        value = cache.get(name, key, _MISSING)
+        if value is _MISSING:
+            value = func(*args, **kwargs)
+            cache.set(name, key, value)
+        return value
+
+    def lookup(*args: Any, **kwargs: Any) -> Any:
+        cache = _active_cache()
+        if cache is None:
+            return None
+        return cache.get(name, (args, tuple(sorted(kwargs.items()))))
+
+    def store(value: Any, *args: Any, **kwargs: Any) -> None:
+        cache = _active_cache()
+        if cache is not None:
+            cache.set(name, (args, tuple(sorted(kwargs.items()))), value)
+
+    wrapper.lookup = lookup  # type: ignore[attr-defined]
+    wrapper.store = store  # type: ignore[attr-defined]
+    return wrapper  # type: ignore[return-value]
@@ -0,0 +1,23 @@
+"""FFT window builders.
+
+A leaf module (NumPy only) so :mod:`.config` can precompute its window without
+importing the analysis package, and with it scipy.fft and the numba detector.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+_WINDOW_BUILDERS = {
+    "hann": np.hanning,
+    "hamming": np.hamming,
+    "blackman": np.blackman,
+}
+
+
+def _resolve_window(name: str, size: int) -> np.ndarray:
+    func = _WINDOW_BUILDERS.get(name.lower())
+    if func is None:
+        return np.ones(size, dtype=np.float32)
+    return func(size).astype(np.float32)
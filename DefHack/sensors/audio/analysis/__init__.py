@@ -1,10 +1,13 @@
-from .signal_processing import amplitude_to_db, compute_fft, estimate_noise_floor
+from .signal_processing import amplitude_to_db, compute_fft, compute_fft_batch, estimate_noise_floor, reduce_spectrum, signal_energy_db
 from .bpf_detection import BPFDetection, detect_bpf
 
 __all__ = [
     "amplitude_to_db",
     "compute_fft",
+    "compute_fft_batch",
     "estimate_noise_floor",
+    "reduce_spectrum",
+    "signal_energy_db",
     "BPFDetection",
     "detect_bpf",
 ]
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import warnings
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 import numpy as np
 
-from .signal_processing import amplitude_to_db, estimate_noise_floor
+from .signal_processing import amplitude_to_db, reduce_spectrum
+
+if TYPE_CHECKING:  # pragma: no cover - import cycle guard
+    from ..config import AcousticConfig
 
 
 @dataclass(frozen=True)
@@ -28,74 +33,233 @@ class BPFDetection:
         }
 
 
-def _find_peaks(values: np.ndarray) -> List[int]:
+def _find_peaks(values: np.ndarray) -> np.ndarray:
     if len(values) < 3:
-        return []
-    peaks = []
-    for i in range(1, len(values) - 1):
-        if values[i] > values[i - 1] and values[i] >= values[i + 1]:
-            peaks.append(i)
-    if not peaks:
-        peaks.append(int(np.argmax(values)))
+        return np.empty(0, dtype=np.int64)
+    inner = values[1:-1]
+    peaks = np.flatnonzero((inner > values[:-2]) & (inner >= values[2:])) + 1
+    if peaks.size == 0:
+        peaks = np.atleast_1d(np.argmax(values)).astype(np.int64)
     return peaks
 
 
-def detect_bpf(
-    freq: np.ndarray,
-    magnitude: np.ndarray,
-    *,
-    min_hz: float,
-    max_hz: float,
+_NO_PEAKS = 0
+_BELOW_PROMINENCE = 1
+_DETECTED = 2
+
+
+def _detect_bpf_numpy(
+    f_roi: np.ndarray,
+    db_roi: np.ndarray,
     prominence_ratio: float,
     expected_harmonics: int,
-) -> BPFDetection:
-    mask = (freq >= min_hz) & (freq <= max_hz)
-    if not np.any(mask):
-        description = "Frequency window returned no candidates"
-        return BPFDetection(None, [], -120.0, -120.0, 0.0, description)
-
-    f_roi = freq[mask]
-    mag_roi = magnitude[mask]
-    db_roi = amplitude_to_db(mag_roi)
-    noise_floor = estimate_noise_floor(db_roi)
+    noise_floor: float,
+):
+    harm_orders = np.zeros(expected_harmonics, dtype=np.int64)
+    harm_freqs = np.zeros(expected_harmonics, dtype=np.float64)
+    harm_amps = np.zeros(expected_harmonics, dtype=np.float64)
 
     peak_indices = _find_peaks(db_roi)
-    if not peak_indices:
-        description = "No tonal components detected"
-        return BPFDetection(None, [], noise_floor, noise_floor, 0.0, description)
+    if peak_indices.size == 0:
+        return _NO_PEAKS, 0.0, noise_floor, 0.0, harm_orders, harm_freqs, harm_amps, 0
 
-    # Sort by amplitude descending
-    peak_indices.sort(key=lambda idx: db_roi[idx], reverse=True)
-    best_idx = peak_indices[0]
+    # Only the strongest peak seeds the harmonic search, so a single argmax pass is enough.
+    best_idx = int(peak_indices[np.argmax(db_roi[peak_indices])])
     fundamental = float(f_roi[best_idx])
     peak_db = float(db_roi[best_idx])
     snr = peak_db - noise_floor
 
     if snr < prominence_ratio:
-        description = "No tonal peaks above noise floor"
-        return BPFDetection(None, [], peak_db, noise_floor, 0.0, description)
+        return _BELOW_PROMINENCE, fundamental, peak_db, snr, harm_orders, harm_freqs, harm_amps, 0
+
+    detection_window = max(fundamental * 0.03, 5.0)
+
+    # Score every harmonic order in one broadcast (H, N_roi) pass instead of H scans.
+    orders = np.arange(1, expected_harmonics + 1)
+    targets = fundamental * orders
+    reachable = targets <= f_roi[-1] + detection_window
+    orders = orders[reachable]
+    targets = targets[reachable]
+    in_window = np.abs(f_roi[None, :] - targets[:, None]) <= detection_window
+    scored = np.where(in_window, db_roi[None, :], -np.inf)
+    best = scored.argmax(axis=1)
+    best_db = scored[np.arange(best.size), best]
+    keep = np.isfinite(best_db) & (best_db - noise_floor >= prominence_ratio / 2.0)
+
+    n_harm = int(np.count_nonzero(keep))
+    harm_orders[:n_harm] = orders[keep]
+    harm_freqs[:n_harm] = f_roi[best[keep]]
+    harm_amps[:n_harm] = best_db[keep]
+
+    return _DETECTED, fundamental, peak_db, snr, harm_orders, harm_freqs, harm_amps, n_harm
+
+
+def _detect_bpf_kernel(
+    f_roi: np.ndarray,
+    db_roi: np.ndarray,
+    prominence_ratio: float,
+    expected_harmonics: int,
+    noise_floor: float,
+):
+    """Single-pass peak pick and harmonic scan; mirrors :func:`_detect_bpf_numpy`."""
+    harm_orders = np.zeros(expected_harmonics, dtype=np.int64)
+    harm_freqs = np.zeros(expected_harmonics, dtype=np.float64)
+    harm_amps = np.zeros(expected_harmonics, dtype=np.float64)
+
+    n = db_roi.shape[0]
+    if n < 3:
+        return _NO_PEAKS, 0.0, noise_floor, 0.0, harm_orders, harm_freqs, harm_amps, 0
+
+    # Strongest local maximum (first one wins on ties), falling back to the global argmax.
+    best_idx = -1
+    for i in range(1, n - 1):
+        value = db_roi[i]
+        if value > db_roi[i - 1] and value >= db_roi[i + 1]:
+            if best_idx < 0 or value > db_roi[best_idx]:
+                best_idx = i
+    if best_idx < 0:
+        best_idx = 0
+        for i in range(1, n):
+            if db_roi[i] > db_roi[best_idx]:
+                best_idx = i
+
+    fundamental = float(f_roi[best_idx])
+    peak_db = float(db_roi[best_idx])
+    snr = peak_db - noise_floor
+    if snr < prominence_ratio:
+        return _BELOW_PROMINENCE, fundamental, peak_db, snr, harm_orders, harm_freqs, harm_amps, 0
 
     detection_window = max(fundamental * 0.03, 5.0)
+    f_last = float(f_roi[n - 1])
+    half_prominence = prominence_ratio / 2.0
 
-    harmonics: List[Dict[str, float]] = []
+    n_harm = 0
     for order in range(1, expected_harmonics + 1):
         target = fundamental * order
-        if target > f_roi[-1] + detection_window:
+        if target > f_last + detection_window:
             break
-        candidates = np.where(np.abs(f_roi - target) <= detection_window)[0]
-        if len(candidates) == 0:
+        # f_roi is ascending: bisect to the window start (one bin early to absorb
+        # rounding at the edge) and stop as soon as a bin lies past the window.
+        best_candidate = -1
+        i = max(0, np.searchsorted(f_roi, target - detection_window) - 1)
+        while i < n and f_roi[i] - target <= detection_window:
+            if abs(f_roi[i] - target) <= detection_window:
+                if best_candidate < 0 or db_roi[i] > db_roi[best_candidate]:
+                    best_candidate = i
+            i += 1
+        if best_candidate < 0:
             continue
-        best_candidate = max(candidates, key=lambda idx: db_roi[idx])
         candidate_db = float(db_roi[best_candidate])
-        if candidate_db - noise_floor < prominence_ratio / 2.0:
+        if candidate_db - noise_floor < half_prominence:
             continue
-        harmonics.append(
-            {
-                "order": float(order),
-                "frequency_hz": float(f_roi[best_candidate]),
-                "amplitude_db": candidate_db,
-            }
+        harm_orders[n_harm] = order
+        harm_freqs[n_harm] = f_roi[best_candidate]
+        harm_amps[n_harm] = candidate_db
+        n_harm += 1
+
+    return _DETECTED, fundamental, peak_db, snr, harm_orders, harm_freqs, harm_amps, n_harm
+
+
+@lru_cache(maxsize=1)
+def _resolve_core():
+    """Return the detector core, JIT-compiling it on first use.
+
+    Deferred to the first :func:`detect_bpf` call so importing the package (or just the
+    config) never pays for numba; falls back to :func:`_detect_bpf_numpy` when numba is
+    missing or cannot build the kernel.
+    """
+    try:  # pragma: no cover - optional dependency
+        import numba
+    except ImportError:  # pragma: no cover - fall back to the NumPy implementation
+        return _detect_bpf_numpy
+    core = numba.njit(cache=True, fastmath=True, boundscheck=False)(_detect_bpf_kernel)
+    # Compile (or load from the on-disk cache) on a tiny dummy spectrum, so a build
+    # failure surfaces here rather than in the middle of a detection.
+    dummy_freq = np.linspace(40.0, 640.0, 16)
+    dummy_db = np.zeros(16, dtype=np.float32)
+    dummy_db[4] = 30.0
+    try:
+        core(dummy_freq, dummy_db, 6.0, 2, 0.0)
+    except Exception as exc:  # pragma: no cover - depends on the numba/LLVM build
+        warnings.warn(
+            f"numba BPF kernel unavailable ({exc}); using the NumPy detector",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        return _detect_bpf_numpy
+    return core
+
+
+def detect_bpf(
+    freq: np.ndarray,
+    magnitude: np.ndarray,
+    *,
+    min_hz: float | None = None,
+    max_hz: float | None = None,
+    prominence_ratio: float | None = None,
+    expected_harmonics: int | None = None,
+    config: AcousticConfig | None = None,
+) -> BPFDetection:
+    if config is not None:
+        min_hz = config.min_bpf_hz if min_hz is None else min_hz
+        max_hz = config.max_bpf_hz if max_hz is None else max_hz
+        prominence_ratio = config.prominence_ratio if prominence_ratio is None else prominence_ratio
+        expected_harmonics = config.num_harmonics if expected_harmonics is None else expected_harmonics
+    if min_hz is None or max_hz is None or prominence_ratio is None or expected_harmonics is None:
+        raise TypeError("detect_bpf requires either a config or explicit detector parameters")
+
+    if (
+        config is not None
+        and freq is config.freq_bins
+        and min_hz == config.min_bpf_hz
+        and max_hz == config.max_bpf_hz
+    ):
+        roi: slice | np.ndarray = config.roi_slice
+        empty = roi.start >= roi.stop
+    else:
+        roi = (freq >= min_hz) & (freq <= max_hz)
+        empty = not np.any(roi)
+    if empty:
+        description = "Frequency window returned no candidates"
+        return BPFDetection(None, [], -120.0, -120.0, 0.0, description)
+
+    f_roi = freq[roi]
+    mag_roi = magnitude[roi]
+    db_roi = amplitude_to_db(mag_roi)
+    peak_val, noise_floor = reduce_spectrum(db_roi)
+
+    # Cheap rejection for the common no-drone frame: if even the loudest bin is not
+    # prominent enough, no peak can be, so skip peak enumeration and the harmonic scan.
+    if peak_val - noise_floor < prominence_ratio:
+        description = "No tonal peaks above noise floor"
+        return BPFDetection(None, [], peak_val, noise_floor, 0.0, description)
+
+    status, fundamental, peak_db, snr, harm_orders, harm_freqs, harm_amps, n_harm = _resolve_core()(
+        f_roi,
+        db_roi,
+        float(prominence_ratio),
+        int(expected_harmonics),
+        float(noise_floor),
+    )
+    if status == _NO_PEAKS:
+        description = "No tonal components detected"
+        return BPFDetection(None, [], noise_floor, noise_floor, 0.0, description)
+    peak_db = float(peak_db)
+    if status == _BELOW_PROMINENCE:
+        description = "No tonal peaks above noise floor"
+        return BPFDetection(None, [], peak_db, noise_floor, 0.0, description)
+
+    fundamental = float(fundamental)
+    snr = float(snr)
+    # One C-level tolist() per column instead of a float() call per harmonic field.
+    harmonics: List[Dict[str, float]] = [
+        {"order": order, "frequency_hz": frequency, "amplitude_db": amplitude}
+        for order, frequency, amplitude in zip(
+            harm_orders[:n_harm].astype(np.float64).tolist(),
+            harm_freqs[:n_harm].tolist(),
+            harm_amps[:n_harm].tolist(),
         )
+    ]
 
     harmonic_ratio = len(harmonics) / max(1, expected_harmonics)
     confidence = max(0.0, min(1.0, (snr / (prominence_ratio * 3.0)) + 0.35 * harmonic_ratio))
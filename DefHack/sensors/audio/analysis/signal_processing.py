@@ -1,46 +1,182 @@
 from __future__ import annotations
 
+import math
+import os
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Sequence
+
 import numpy as np
 
+try:  # pragma: no cover - optional dependency
+    import scipy.fft as _scipy_fft
+except ImportError:  # pragma: no cover - fall back to numpy's FFT
+    _scipy_fft = None
+
+from .._windows import _resolve_window
+
+if TYPE_CHECKING:  # pragma: no cover - import cycle guard
+    from ..config import AcousticConfig
+
+
+@lru_cache(maxsize=8)
+def _cached_window(name: str, size: int) -> np.ndarray:
+    # Shared across calls, so it is frozen like AcousticConfig.window_buf.
+    win = _resolve_window(name, size)
+    win.setflags(write=False)
+    return win
+
+
+@lru_cache(maxsize=16)
+def _rfft_freqs(fft_size: int, fs: float) -> np.ndarray:
+    freq = np.fft.rfftfreq(fft_size, 1.0 / fs)
+    freq.setflags(write=False)
+    return freq
+
+
+def _fft_workers() -> int:
+    # scipy.fft ignores OMP_NUM_THREADS; honour it so pool workers stay single-threaded.
+    value = os.environ.get("OMP_NUM_THREADS", "")
+    return int(value) if value.isdigit() and int(value) > 0 else -1
+
+
+def _rfft(frames: np.ndarray, *, batched: bool = False, scratch: bool = False) -> np.ndarray:
+    # scipy's pocketfft keeps float32 frames in single precision and can split a batch
+    # across threads; a single frame is too small to be worth threading. Scratch input
+    # may be clobbered, which lets pocketfft skip its defensive copy.
+    if _scipy_fft is not None:
+        workers = _fft_workers() if batched else 1
+        return _scipy_fft.rfft(frames, axis=-1, workers=workers, overwrite_x=scratch or batched)
+    return np.fft.rfft(frames, axis=-1)
+
+
+_SCRATCH = threading.local()
 
-_WINDOW_BUILDERS = {
-    "hann": np.hanning,
-    "hamming": np.hamming,
-    "blackman": np.blackman,
-}
 
+def _scratch_frame(fft_size: int) -> np.ndarray:
+    frames = getattr(_SCRATCH, "frames", None)
+    if frames is None:
+        frames = _SCRATCH.frames = {}
+    frame = frames.get(fft_size)
+    if frame is None:
+        frame = frames[fft_size] = np.empty(fft_size, dtype=np.float32)
+    return frame
 
-def _resolve_window(name: str, size: int) -> np.ndarray:
-    func = _WINDOW_BUILDERS.get(name.lower())
-    if func is None:
-        return np.ones(size)
-    return func(size)
 
+def compute_fft(
+    signal: np.ndarray,
+    fs: float,
+    *,
+    fft_size: int | None = None,
+    window: str | None = None,
+    config: AcousticConfig | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    if config is not None:
+        fft_size = config.fft_size
+        window = config.window
+    if fft_size is None or window is None:
+        raise TypeError("compute_fft requires either a config or both fft_size and window")
 
-def compute_fft(signal: np.ndarray, fs: float, *, fft_size: int, window: str) -> tuple[np.ndarray, np.ndarray]:
-    if fft_size < len(signal):
-        trimmed = signal[:fft_size]
-    elif fft_size > len(signal):
-        padded = np.zeros(fft_size, dtype=signal.dtype)
-        padded[: len(signal)] = signal
-        trimmed = padded
+    # Single precision is plenty for blade-pass detection and halves memory traffic.
+    # The frame is assembled and windowed in a per-thread scratch buffer, so streaming
+    # calls reuse one allocation; only the returned magnitude is freshly allocated.
+    count = min(fft_size, len(signal))
+    frame = _scratch_frame(fft_size)
+    frame[:count] = signal[:count]
+    frame[count:] = 0.0
+
+    # Explicit (fft_size, window) calls get the same precomputed window and bins a
+    # config carries, so a fixed-shape caller never rebuilds them per frame.
+    win = config.window_buf if config is not None else _cached_window(window, fft_size)
+    np.multiply(frame, win, out=frame)
+    spectrum = _rfft(frame, scratch=True)
+    if config is not None and fs == config.sampling_rate:
+        freq = config.freq_bins
     else:
-        trimmed = signal
+        freq = _rfft_freqs(fft_size, fs)
+    magnitude = np.abs(spectrum).astype(np.float32, copy=False)
+    magnitude /= np.float32(fft_size / 2.0)
+    return freq, magnitude
+
+
+def compute_fft_batch(
+    signals: Sequence[np.ndarray],
+    fs: float,
+    *,
+    fft_size: int | None = None,
+    window: str | None = None,
+    config: AcousticConfig | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Batched :func:`compute_fft`: one ``(len(signals), bins)`` magnitude matrix.
+
+    Every signal is trimmed or zero-padded to ``fft_size``, so the frames stack into a
+    single matrix and one row-wise rfft replaces a transform per signal.
+    """
+    if config is not None:
+        fft_size = config.fft_size
+        window = config.window
+    if fft_size is None or window is None:
+        raise TypeError("compute_fft_batch requires either a config or both fft_size and window")
+
+    frames = np.zeros((len(signals), fft_size), dtype=np.float32)
+    for row, signal in zip(frames, signals):
+        count = min(fft_size, len(signal))
+        row[:count] = signal[:count]
 
-    win = _resolve_window(window, len(trimmed))
-    windowed = trimmed * win
-    spectrum = np.fft.rfft(windowed)
-    freq = np.fft.rfftfreq(len(windowed), 1.0 / fs)
-    magnitude = np.abs(spectrum) / (len(windowed) / 2.0)
+    win = config.window_buf if config is not None else _cached_window(window, fft_size)
+    frames *= win
+    spectrum = _rfft(frames, batched=True)
+    if config is not None and fs == config.sampling_rate:
+        freq = config.freq_bins
+    else:
+        freq = _rfft_freqs(fft_size, fs)
+    magnitude = np.abs(spectrum).astype(np.float32, copy=False)
+    magnitude /= np.float32(fft_size / 2.0)
     return freq, magnitude
 
 
+def signal_energy_db(signal: np.ndarray) -> float:
+    """Mean signal power in dBFS from a single dot product (no FFT)."""
+    count = len(signal)
+    if count == 0:
+        return -200.0
+    power = float(np.dot(signal, signal)) / count
+    return 10.0 * math.log10(power + 1e-20)
+
+
 def amplitude_to_db(values: np.ndarray, floor_db: float = -120.0) -> np.ndarray:
-    ref = np.maximum(values, 1e-12)
-    db = 20.0 * np.log10(ref)
-    return np.maximum(db, floor_db)
+    # Scalars are Python floats so float32 input stays float32 (1e-12 is a normal float32).
+    # One temporary, converted in place; same operation order as 20 * log10(max(x, eps)).
+    db = np.maximum(values, 1e-12)
+    if not isinstance(db, np.ndarray):
+        # Scalar input: ufuncs return NumPy scalars, which cannot be written in place.
+        return np.maximum(20.0 * np.log10(db), floor_db)
+    np.log10(db, out=db)
+    db *= 20.0
+    return np.maximum(db, floor_db, out=db)
 
 
 def estimate_noise_floor(db_spectrum: np.ndarray) -> float:
-    # Median as noise approximation
-    return float(np.median(db_spectrum))
+    # Median as noise approximation, via O(N) selection rather than a full sort
+    n = db_spectrum.size
+    mid = n // 2
+    if n % 2:
+        return float(np.partition(db_spectrum, mid)[mid])
+    lower, upper = np.partition(db_spectrum, (mid - 1, mid))[mid - 1 : mid + 1]
+    return (float(lower) + float(upper)) / 2.0
+
+
+def reduce_spectrum(db_spectrum: np.ndarray) -> tuple[float, float]:
+    """Return ``(peak_db, noise_floor_db)`` from a single selection pass.
+
+    One ``np.partition`` places both middle order statistics and the maximum, so the
+    peak and the median noise floor (as :func:`estimate_noise_floor`) share one pass.
+    """
+    n = db_spectrum.size
+    mid = n // 2
+    kth = sorted({max(mid - 1, 0), mid, n - 1})
+    ordered = np.partition(db_spectrum, kth)
+    peak = float(ordered[n - 1])
+    if n % 2:
+        return peak, float(ordered[mid])
+    return peak, (float(ordered[mid - 1]) + float(ordered[mid])) / 2.0
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, Mapping, MutableMapping
+from typing import Any, Dict, Iterable, Mapping, MutableMapping, Tuple
+
+import numpy as np
+
+from ._windows import _resolve_window
 
 
 _DEFAULT_CONFIG_PATH = Path(__file__).with_name("config.yaml")
@@ -33,7 +38,7 @@ def _parse_simple_yaml(text: str) -> Dict[str, Any]:
     return data
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AcousticConfig:
     sampling_rate: int = 44_100
     fft_size: int = 4_096
@@ -46,6 +51,23 @@ class AcousticConfig:
     default_rpm: float = 4_800.0
     default_blades: int = 4
     simulation_noise_level: float = 0.02
+    # In-memory frames quieter than this (mean power, dBFS) skip the FFT entirely.
+    energy_gate_db: float = -90.0
+    # Derived spectrum state, computed once so the FFT and detector don't rebuild it per call.
+    freq_bins: np.ndarray = field(init=False, repr=False, compare=False)
+    window_buf: np.ndarray = field(init=False, repr=False, compare=False)
+    roi_slice: slice = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        freq_bins = np.fft.rfftfreq(self.fft_size, 1.0 / self.sampling_rate)
+        window_buf = _resolve_window(self.window, self.fft_size)
+        freq_bins.setflags(write=False)
+        window_buf.setflags(write=False)
+        start = int(np.searchsorted(freq_bins, self.min_bpf_hz, side="left"))
+        stop = int(np.searchsorted(freq_bins, self.max_bpf_hz, side="right"))
+        object.__setattr__(self, "freq_bins", freq_bins)
+        object.__setattr__(self, "window_buf", window_buf)
+        object.__setattr__(self, "roi_slice", slice(start, max(start, stop)))
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -60,11 +82,11 @@ class AcousticConfig:
             "default_rpm": self.default_rpm,
             "default_blades": self.default_blades,
             "simulation_noise_level": self.simulation_noise_level,
+            "energy_gate_db": self.energy_gate_db,
         }
 
 
-def load_config(path: str | Path | None = None, overrides: Mapping[str, Any] | None = None) -> AcousticConfig:
-    config_path = Path(path) if path else _DEFAULT_CONFIG_PATH
+def _load_config_impl(config_path: Path, overrides: Mapping[str, Any] | None) -> AcousticConfig:
     if config_path.exists():
         text = config_path.read_text(encoding="utf-8")
         payload = _parse_simple_yaml(text)
@@ -81,6 +103,31 @@ def load_config(path: str | Path | None = None, overrides: Mapping[str, Any] | N
     return AcousticConfig(**{**AcousticConfig().to_dict(), **payload})
 
 
+@lru_cache(maxsize=32)
+def _load_config_cached(
+    path: str,
+    mtime_ns: int | None,
+    override_items: Tuple[Tuple[str, Any], ...],
+) -> AcousticConfig:
+    # mtime_ns is only part of the key: an edited config file gets a fresh entry.
+    return _load_config_impl(Path(path), dict(override_items))
+
+
+def load_config(path: str | Path | None = None, overrides: Mapping[str, Any] | None = None) -> AcousticConfig:
+    config_path = Path(path) if path else _DEFAULT_CONFIG_PATH
+    try:
+        mtime_ns: int | None = config_path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    override_items = tuple(sorted(overrides.items())) if overrides else ()
+    try:
+        hash(override_items)
+    except TypeError:  # unhashable override value; parse without the cache
+        return _load_config_impl(config_path, overrides)
+    # AcousticConfig is frozen, so one parsed instance can be shared by every caller.
+    return _load_config_cached(str(config_path), mtime_ns, override_items)
+
+
 def update_config_file(path: str | Path, updates: Mapping[str, Any]) -> None:
     existing = load_config(path)
     merged = {**existing.to_dict(), **updates}
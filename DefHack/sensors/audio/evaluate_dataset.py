@@ -2,21 +2,31 @@ from __future__ import annotations
 
 import argparse
 import csv
+import itertools
 import json
+import os
 import re
 import random
-from collections import defaultdict
+from array import array
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 try:
     from tqdm import tqdm
+    from tqdm.contrib.concurrent import process_map
 except ImportError:  # pragma: no cover - tqdm is optional at runtime
     tqdm = None
+    process_map = None
 
 from .config import load_config
-from .pipeline import analyze_audio
+from .pipeline import Detector, _spectrum_cached
 
 
 @dataclass(frozen=True)
@@ -98,6 +108,7 @@ DDL_REGEX = re.compile(
 )
 
 
+@lru_cache(maxsize=None)
 def _parse_ddl_filename(name: str) -> Optional[Dict[str, Any]]:
     stem = Path(name).stem
     match = DDL_REGEX.match(stem)
@@ -130,9 +141,24 @@ def _parse_ddl_filename(name: str) -> Optional[Dict[str, Any]]:
 
 
 def _iter_wav_files(root: Path) -> Iterable[Path]:
-    for path in sorted(root.rglob("*.wav")):
-        if path.is_file():
-            yield path
+    # os.scandir exposes the readdir file type, so there is no per-file stat and no
+    # up-front materialisation. Sorting each directory by name (files and subdirectories
+    # together) reproduces the old sorted(root.rglob("*.wav")) order.
+    with os.scandir(root) as it:
+        dir_entries = sorted(it, key=lambda entry: entry.name)
+    for entry in dir_entries:
+        # Like rglob, do not descend into symlinked directories; with
+        # follow_symlinks=False this never stats unless d_type is DT_UNKNOWN.
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_wav_files(Path(entry.path))
+        elif entry.name.endswith(".wav") and entry.is_file():
+            # Only symlinks (and DT_UNKNOWN entries) reach stat() here.
+            yield Path(entry.path)
+
+
+def _collect_entries(root: Path) -> List[Tuple[Path, FileMetadata]]:
+    """Scan ``root`` once and pair every WAV file with its inferred metadata."""
+    return [(wav_path, _infer_metadata(root, wav_path)) for wav_path in _iter_wav_files(root)]
 
 
 def _balanced_shuffle(
@@ -153,23 +179,149 @@ def _balanced_shuffle(
     for label in labels:
         rng.shuffle(buckets[label])
 
-    ordered: List[Tuple[Path, FileMetadata]] = []
-    active = [label for label in labels if buckets[label]]
-
-    while active:
-        next_active: List[str] = []
-        for label in active:
-            bucket = buckets[label]
-            if not bucket:
-                continue
-            ordered.append(bucket.pop())
-            if bucket:
-                next_active.append(label)
-        active = next_active
+    if len(labels) == 1:
+        return buckets[labels[0]][::-1]
+
+    # Round-robin across labels (each bucket drained from its end) as one stable argsort:
+    # the r-th item taken from label i gets key r * L + i.
+    label_count = len(labels)
+    flat: List[Tuple[Path, FileMetadata]] = []
+    keys = []
+    for i, label in enumerate(labels):
+        bucket = buckets[label]
+        flat.extend(reversed(bucket))
+        keys.append(np.arange(len(bucket)) * label_count + i)
+    order = np.argsort(np.concatenate(keys), kind="stable")
+    ordered = [flat[index] for index in order.tolist()]
 
     return ordered
 
 
+def _record_from_schema(root: Path, wav_path: Path, metadata: FileMetadata, schema) -> EvaluationRecord:
+    fundamental = schema.metadata.get("fundamental_hz")
+    snr = schema.metadata.get("snr_db")
+    extras = metadata.extras
+    return EvaluationRecord(
+        relative_path=str(wav_path.relative_to(root)),
+        label=metadata.label,
+        configuration=metadata.configuration,
+        mission=metadata.mission,
+        model=extras.get("model"),
+        bearing_deg=extras.get("bearing_deg"),
+        range_m=extras.get("range_m"),
+        altitude_m=extras.get("altitude_m"),
+        temperature_k=extras.get("temperature_k"),
+        sample_type=extras.get("sample_type"),
+        timestamp=extras.get("timestamp"),
+        flight_session_id=extras.get("flight_session_id"),
+        recording_session_id=extras.get("recording_session_id"),
+        sequence_id=extras.get("sequence_id"),
+        detected=fundamental is not None,
+        fundamental_hz=fundamental,
+        harmonics=int(schema.metadata.get("harmonic_count", 0)),
+        confidence_pct=int(schema.metadata.get("confidence_pct", 0)),
+        snr_db=float(snr) if snr is not None else None,
+        peak_db=schema.metadata.get("peak_db"),
+        noise_floor_db=schema.metadata.get("noise_floor_db"),
+        description=schema.summary,
+    )
+
+
+# Files pushed through one FFT call on the serial path.
+_FFT_BATCH = 32
+
+
+@lru_cache(maxsize=8)
+def _detector(override_items: Tuple[Tuple[str, Any], ...]) -> Detector:
+    # One detector per override set and process: a dataset run (or sweep combo) reuses it
+    # for every file instead of re-loading and re-deriving the config per file.
+    return Detector(load_config(overrides=dict(override_items)))
+
+
+def _place_for(metadata: FileMetadata) -> str:
+    return f"{metadata.label}:{metadata.configuration}:{metadata.mission}"
+
+
+def _analyze_one(payload: Tuple[Path, FileMetadata, str, Dict[str, Any], bool]) -> EvaluationRecord:
+    """Analyse a single file; top-level so it can be shipped to pool workers."""
+    wav_path, metadata, root_str, overrides, save_report = payload
+    schema = _detector(tuple(sorted(overrides.items()))).analyze(
+        wav_path,
+        place=_place_for(metadata),
+        save_report=save_report,
+    )
+    return _record_from_schema(Path(root_str), wav_path, metadata, schema)
+
+
+def _analyze_batch(
+    payloads: Sequence[Tuple[Path, FileMetadata, str, Dict[str, Any], bool]],
+    raw_bytes: Sequence[Optional[bytes]],
+) -> List[EvaluationRecord]:
+    """Analyse files that share one override set with a single batched FFT."""
+    _, _, root_str, overrides, save_report = payloads[0]
+    schemas = _detector(tuple(sorted(overrides.items()))).analyze_batch(
+        [payload[0] for payload in payloads],
+        places=[_place_for(payload[1]) for payload in payloads],
+        raw_bytes=raw_bytes,
+        save_report=save_report,
+    )
+    root = Path(root_str)
+    return [
+        _record_from_schema(root, wav_path, metadata, schema)
+        for (wav_path, metadata, *_), schema in zip(payloads, schemas)
+    ]
+
+
+def _iter_serial(
+    payloads: Sequence[Tuple[Path, FileMetadata, str, Dict[str, Any], bool]],
+    batch_size: int = _FFT_BATCH,
+    prefetch: Optional[int] = None,
+) -> Iterator[EvaluationRecord]:
+    if not payloads:
+        return
+    config = _detector(tuple(sorted(payloads[0][3].items()))).config
+
+    def needs_read(path: Path) -> bool:
+        return not _spectrum_cached(path, config)
+
+    # By default keep a whole batch of reads in flight while the current batch is analysed;
+    # files whose spectrum is already cached are never read.
+    prefetched = _prefetch_iter(
+        (payload[0] for payload in payloads), k=max(1, prefetch or batch_size), want=needs_read
+    )
+    for start in range(0, len(payloads), batch_size):
+        batch = payloads[start : start + batch_size]
+        raw_bytes = [data for _, data in itertools.islice(prefetched, len(batch))]
+        yield from _analyze_batch(batch, raw_bytes)
+
+
+def _prefetch_iter(
+    paths: Iterable[Path],
+    k: int = 4,
+    want: Optional[Callable[[Path], bool]] = None,
+) -> Iterator[Tuple[Path, Optional[bytes]]]:
+    """Yield ``(path, bytes)`` in order while reading up to ``k`` files ahead on threads.
+
+    Paths rejected by ``want`` are not read; they are yielded with ``None``.
+    """
+    with ThreadPoolExecutor(max_workers=k) as pool:
+        pending: deque = deque()
+        for path in paths:
+            future = pool.submit(path.read_bytes) if want is None or want(path) else None
+            pending.append((path, future))
+            if len(pending) > k:
+                head, future = pending.popleft()
+                yield head, future.result() if future is not None else None
+        while pending:
+            head, future = pending.popleft()
+            yield head, future.result() if future is not None else None
+
+
+def _default_jobs() -> int:
+    # Past ~8 processes the per-file work is small enough that disk and IPC dominate.
+    return min(8, os.cpu_count() or 1)
+
+
 def evaluate_dataset(
     root: Path,
     *,
@@ -178,104 +330,98 @@ def evaluate_dataset(
     save_reports: bool = False,
     show_progress: bool = True,
     shuffle_seed: Optional[int] = None,
+    workers: Optional[int] = 1,
+    chunksize: Optional[int] = None,
+    io_prefetch: Optional[int] = None,
+    entries: Optional[Sequence[Tuple[Path, FileMetadata]]] = None,
 ) -> List[EvaluationRecord]:
     root = root.expanduser().resolve()
     if not root.exists():
         raise FileNotFoundError(f"Dataset root '{root}' does not exist")
 
     config_overrides = overrides or {}
-    results: List[EvaluationRecord] = []
 
-    entries: List[Tuple[Path, FileMetadata]] = [
-        (wav_path, _infer_metadata(root, wav_path)) for wav_path in _iter_wav_files(root)
-    ]
-    entries = _balanced_shuffle(entries, seed=shuffle_seed)
+    # Callers evaluating the same tree repeatedly (parameter sweeps) pass pre-collected entries.
+    if entries is None:
+        entries = _collect_entries(root)
+    selected = _balanced_shuffle(entries, seed=shuffle_seed)
 
     if max_files is not None:
-        entries = entries[:max_files]
+        selected = selected[:max_files]
+
+    payloads = [
+        (wav_path, metadata, str(root), config_overrides, save_reports)
+        for wav_path, metadata in selected
+    ]
 
-    iterator: Iterable[Tuple[Path, FileMetadata]] = entries
+    worker_count = max(1, workers or 1)
+    chunk = chunksize or max(1, len(payloads) // (4 * worker_count))
+    if worker_count > 1 and len(payloads) > 1:
+        if process_map is not None and show_progress:
+            return process_map(
+                _analyze_one,
+                payloads,
+                max_workers=worker_count,
+                chunksize=chunk,
+                desc="Evaluating dataset",
+                unit="file",
+                leave=False,
+            )
+        with ProcessPoolExecutor(max_workers=worker_count) as pool:
+            return list(pool.map(_analyze_one, payloads, chunksize=chunk))
+
+    results: Iterable[EvaluationRecord] = _iter_serial(payloads, prefetch=io_prefetch)
     if tqdm is not None and show_progress:
-        iterator = tqdm(
-            entries,
+        results = tqdm(
+            results,
             desc="Evaluating dataset",
             unit="file",
-            total=len(entries),
+            total=len(payloads),
             leave=False,
         )
 
-    for wav_path, metadata in iterator:
-        schema = analyze_audio(
-            wav_path,
-            overrides=config_overrides,
-            place=f"{metadata.label}:{metadata.configuration}:{metadata.mission}",
-            save_report=save_reports,
-        )
-        fundamental = schema.metadata.get("fundamental_hz")
-        snr = schema.metadata.get("snr_db")
-        extras = metadata.extras
-        record = EvaluationRecord(
-            relative_path=str(wav_path.relative_to(root)),
-            label=metadata.label,
-            configuration=metadata.configuration,
-            mission=metadata.mission,
-            model=extras.get("model"),
-            bearing_deg=extras.get("bearing_deg"),
-            range_m=extras.get("range_m"),
-            altitude_m=extras.get("altitude_m"),
-            temperature_k=extras.get("temperature_k"),
-            sample_type=extras.get("sample_type"),
-            timestamp=extras.get("timestamp"),
-            flight_session_id=extras.get("flight_session_id"),
-            recording_session_id=extras.get("recording_session_id"),
-            sequence_id=extras.get("sequence_id"),
-            detected=fundamental is not None,
-            fundamental_hz=fundamental,
-            harmonics=int(schema.metadata.get("harmonic_count", 0)),
-            confidence_pct=int(schema.metadata.get("confidence_pct", 0)),
-            snr_db=float(snr) if snr is not None else None,
-            peak_db=schema.metadata.get("peak_db"),
-            noise_floor_db=schema.metadata.get("noise_floor_db"),
-            description=schema.summary,
-        )
-        results.append(record)
-
-    return results
+    return list(results)
 
 
 def _aggregate(results: Iterable[EvaluationRecord]) -> Dict[str, Any]:
-    totals = defaultdict(
-        lambda: {
-            "count": 0,
-            "detections": 0,
-            "confidences": [],
-            "fundamentals": [],
-        }
-    )
+    # One pass assigns each label a slot and appends into flat typed columns.
+    label_ids: Dict[str, int] = {}
+    indices = array("q")
+    detected = array("d")
+    confidences = array("d")
+    fundamentals = array("d")
     for record in results:
-        entry = totals[record.label]
-        entry["count"] += 1
-        entry["detections"] += int(record.detected)
-        entry["confidences"].append(record.confidence_pct)
-        if record.detected and record.fundamental_hz is not None:
-            entry["fundamentals"].append(record.fundamental_hz)
+        indices.append(label_ids.setdefault(record.label, len(label_ids)))
+        detected.append(record.detected)
+        confidences.append(record.confidence_pct)
+        fundamental = record.fundamental_hz if record.detected else None
+        fundamentals.append(np.nan if fundamental is None else fundamental)
+
+    label_count = len(label_ids)
+    index = np.frombuffer(indices, dtype=np.int64)
+    fundamental_values = np.frombuffer(fundamentals, dtype=np.float64)
+    has_fundamental = ~np.isnan(fundamental_values)
+    counts = np.bincount(index, minlength=label_count)
+    detections = np.bincount(index, weights=np.frombuffer(detected, dtype=np.float64), minlength=label_count)
+    conf_sum = np.bincount(index, weights=np.frombuffer(confidences, dtype=np.float64), minlength=label_count)
+    fund_sum = np.bincount(
+        index[has_fundamental], weights=fundamental_values[has_fundamental], minlength=label_count
+    )
+    fund_count = np.bincount(index[has_fundamental], minlength=label_count)
+
+    safe_counts = np.maximum(counts, 1)
+    avg_confidences = conf_sum / safe_counts
+    detection_rates = detections / safe_counts
+    avg_fundamentals = np.where(fund_count > 0, fund_sum / np.maximum(fund_count, 1), 0.0)
 
     summary = {}
-    for label, value in totals.items():
-        count = value["count"]
-        detections = value["detections"]
-        avg_conf = sum(value["confidences"]) / count if count else 0.0
-        avg_fundamental = (
-            sum(value["fundamentals"]) / len(value["fundamentals"])
-            if value["fundamentals"]
-            else 0.0
-        )
+    for label, i in label_ids.items():
         summary[label] = {
-            "count": count,
-            "detections": detections,
-            "detection_rate": detections / count if count else 0.0,
-            "avg_confidence": avg_conf,
-            "avg_fundamental_hz": avg_fundamental,
+            "count": int(counts[i]),
+            "detections": int(detections[i]),
+            "detection_rate": float(detection_rates[i]),
+            "avg_confidence": float(avg_confidences[i]),
+            "avg_fundamental_hz": float(avg_fundamentals[i]),
         }
 
     total_files = sum(value["count"] for value in summary.values())
@@ -326,11 +472,11 @@ def _write_output(path: Path, records: List[EvaluationRecord], fmt: str = "csv")
         "noise_floor_db",
         "description",
     ]
-    with path.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        for record in records:
-            writer.writerow(record.__dict__)
+    row_for = attrgetter(*fieldnames)
+    with path.open("w", buffering=1 << 20, newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(fieldnames)
+        writer.writerows(row_for(record) for record in records)
 
 
 def main(argv: Optional[List[str]] = None) -> None:
@@ -363,6 +509,26 @@ def main(argv: Optional[List[str]] = None) -> None:
         default=None,
         help="Shuffle seed for balanced sampling across labels",
     )
+    parser.add_argument(
+        "--jobs",
+        "--workers",
+        dest="jobs",
+        type=int,
+        default=None,
+        help="Worker processes for per-file analysis (default: min(8, CPU count); 1 runs serially)",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="Files handed to a worker per dispatch (default: derived from file and worker counts)",
+    )
+    parser.add_argument(
+        "--io-prefetch",
+        type=int,
+        default=None,
+        help=f"Files read ahead on threads in serial runs (default: {_FFT_BATCH})",
+    )
     args = parser.parse_args(argv)
 
     overrides: Dict[str, Any] = {}
@@ -375,6 +541,11 @@ def main(argv: Optional[List[str]] = None) -> None:
     # Validate overrides by instantiating configuration
     _ = load_config(overrides=overrides)
 
+    jobs = args.jobs if args.jobs is not None else _default_jobs()
+    if jobs > 1:
+        # Each process already owns a core; keep native math libraries single-threaded.
+        os.environ.setdefault("OMP_NUM_THREADS", "1")
+
     records = evaluate_dataset(
         args.root,
         max_files=args.max_files,
@@ -382,6 +553,9 @@ def main(argv: Optional[List[str]] = None) -> None:
         save_reports=args.reports,
         show_progress=not args.no_progress,
         shuffle_seed=args.seed,
+        workers=jobs,
+        chunksize=args.chunksize,
+        io_prefetch=args.io_prefetch,
     )
     summary = _aggregate(records)
 
@@ -4,6 +4,10 @@ import math
 from dataclasses import dataclass
 from typing import Dict
 
+_TWO_PI = 2.0 * math.pi
+_INV_60 = 1.0 / 60.0
+_MIN_MACH_LOG10 = math.log10(1e-6)
+
 
 @dataclass(frozen=True)
 class RotorSpecification:
@@ -27,11 +31,11 @@ class RotorSpecification:
 
 
 def blade_pass_frequency(rpm: float, blades: int) -> float:
-    return float(blades) * float(rpm) / 60.0
+    return blades * rpm * _INV_60
 
 
 def tip_speed(rpm: float, radius_m: float) -> float:
-    return 2.0 * math.pi * (rpm / 60.0) * radius_m
+    return _TWO_PI * rpm * radius_m * _INV_60
 
 
 def tip_mach_number(rpm: float, radius_m: float, speed_of_sound: float = 343.0) -> float:
@@ -40,13 +44,15 @@ def tip_mach_number(rpm: float, radius_m: float, speed_of_sound: float = 343.0)
 
 def sound_pressure_level(spec: RotorSpecification, reference_pressure: float = 20e-6) -> float:
     """Return a crude broadband SPL estimate based on tip Mach number."""
-    mach = spec.tip_mach_number
+    speed = spec.tip_speed
+    mach = speed / spec.speed_of_sound
     if mach <= 0:
         return -math.inf
     # Empirical log fit: L_p ≈ 50 + 40 log10(M)
-    base = 50.0 + 40.0 * math.log10(max(mach, 1e-6))
-    return base + 20 * math.log10(spec.tip_speed / reference_pressure)
+    base = 50.0 + 40.0 * (math.log10(mach) if mach > 1e-6 else _MIN_MACH_LOG10)
+    return base + 20.0 * math.log10(speed / reference_pressure)
 
 
 def expected_harmonic_frequencies(spec: RotorSpecification, count: int) -> Dict[int, float]:
-    return {k: spec.blade_pass_frequency * k for k in range(1, count + 1)}
+    fundamental = spec.blade_pass_frequency
+    return {k: fundamental * k for k in range(1, count + 1)}
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
-import math
+from functools import lru_cache
 from typing import Dict, Tuple
 
 import numpy as np
 
-from .acoustic_model import RotorSpecification
+from .acoustic_model import _TWO_PI, RotorSpecification
+
+# Harmonic synthesis runs in time blocks so the (block, harmonics) phase matrix stays cache-sized.
+_BLOCK_SAMPLES = 16_384
+
+
+@lru_cache(maxsize=8)
+def _time_axis(sample_count: int, duration_s: float) -> np.ndarray:
+    t = np.linspace(0.0, duration_s, sample_count, endpoint=False)
+    t.setflags(write=False)
+    return t
 
 
 def simulate_rotor_noise(
@@ -15,22 +25,57 @@ def simulate_rotor_noise(
     spec: RotorSpecification,
     harmonics: int | None = None,
     noise_level: float | None = None,
+    out: np.ndarray | None = None,
+    rng: np.random.Generator | int | None = None,
 ) -> Tuple[np.ndarray, np.ndarray, Dict[str, float]]:
+    """Synthesise a rotor tone stack plus white noise.
+
+    The returned time axis is shared between calls with the same length and is read-only.
+    The float32 signal is written into ``out`` when given (it must hold exactly
+    ``int(sampling_rate * duration_s)`` float32 samples), otherwise into a fresh array.
+    Noise is drawn from ``rng`` (a Generator or a seed); by default a freshly seeded
+    Generator, so pass a seed for reproducible output. The global ``np.random`` state
+    is not used.
+    """
     fs = config.sampling_rate
+    rng = np.random.default_rng(rng)
     harmonics = harmonics or config.num_harmonics
     noise_level = noise_level if noise_level is not None else config.simulation_noise_level
 
     sample_count = int(fs * duration_s)
-    t = np.linspace(0.0, duration_s, sample_count, endpoint=False)
-    signal = np.zeros_like(t)
+    t = _time_axis(sample_count, duration_s)
+    if out is None:
+        signal = np.empty(sample_count, dtype=np.float32)
+    elif out.dtype != np.float32 or out.shape != (sample_count,):
+        raise ValueError(f"out must be a float32 array of shape ({sample_count},)")
+    else:
+        signal = out
     fundamental = spec.blade_pass_frequency
 
-    for k in range(1, harmonics + 1):
-        amplitude = 1.0 / k
-        signal += amplitude * np.sin(2 * math.pi * fundamental * k * t)
-
-    if noise_level > 0:
-        signal += noise_level * np.random.randn(sample_count)
+    orders = np.arange(1, harmonics + 1, dtype=np.float64)
+    amplitudes = 1.0 / orders
+    omega = _TWO_PI * fundamental
+    # Per-call workspaces, reused by every block: the phase matrix stays float64 for
+    # accuracy at large t, the noise block is generated directly in float32.
+    phase_buf = np.empty((min(_BLOCK_SAMPLES, sample_count), harmonics), dtype=np.float64)
+    tone_buf = np.empty(phase_buf.shape[0], dtype=np.float64)
+    noise_buf = np.empty(phase_buf.shape[0], dtype=np.float32)
+    for start in range(0, sample_count, _BLOCK_SAMPLES):
+        stop = min(start + _BLOCK_SAMPLES, sample_count)
+        width = stop - start
+        phase = phase_buf[:width]
+        tone = tone_buf[:width]
+        np.multiply(t[start:stop], omega, out=tone)
+        np.multiply.outer(tone, orders, out=phase)
+        np.sin(phase, out=phase)
+        np.dot(phase, amplitudes, out=tone)
+        block = signal[start:stop]
+        block[...] = tone
+        if noise_level > 0:
+            noise = noise_buf[:width]
+            rng.standard_normal(dtype=np.float32, out=noise)
+            noise *= np.float32(noise_level)
+            block += noise
 
     metadata = {
         "timestamp": float(sample_count) / fs,
@@ -39,4 +84,4 @@ def simulate_rotor_noise(
         "fundamental_hz": fundamental,
         "harmonics": harmonics,
     }
-    return t, signal.astype(np.float32), metadata
+    return t, signal, metadata
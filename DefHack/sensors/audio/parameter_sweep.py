@@ -3,11 +3,16 @@ from __future__ import annotations
 import argparse
 import csv
 import itertools
-import statistics
+import os
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
-from .evaluate_dataset import EvaluationRecord, evaluate_dataset
+import numpy as np
+
+from ._cache import DEFAULT_CACHE_DIR, enable_disk_cache
+from .evaluate_dataset import EvaluationRecord, _collect_entries, _default_jobs, evaluate_dataset
 
 
 def _coerce_override(value: float | int | str) -> str:
@@ -18,23 +23,46 @@ def _coerce_override(value: float | int | str) -> str:
 
 def _summarize(records: Sequence[EvaluationRecord]) -> Dict[str, float]:
     total = len(records)
-    detections = sum(1 for record in records if record.detected)
-    avg_conf = statistics.fmean(record.confidence_pct for record in records) if records else 0.0
-    snrs = [record.snr_db for record in records if record.snr_db is not None]
-    avg_snr = statistics.fmean(snrs) if snrs else 0.0
-    fundamentals = [record.fundamental_hz for record in records if record.fundamental_hz is not None]
-    avg_fund = statistics.fmean(fundamentals) if fundamentals else 0.0
+    if not total:
+        return {
+            "total_files": 0.0,
+            "detections": 0.0,
+            "detection_rate": 0.0,
+            "avg_confidence": 0.0,
+            "avg_snr": 0.0,
+            "avg_fundamental": 0.0,
+        }
+
+    # Missing SNR / fundamental values become NaN and are skipped by the masked means.
+    detected = np.fromiter((record.detected for record in records), dtype=bool, count=total)
+    confidences = np.fromiter((record.confidence_pct for record in records), dtype=np.float64, count=total)
+    snrs = np.fromiter(
+        (np.nan if record.snr_db is None else record.snr_db for record in records),
+        dtype=np.float64,
+        count=total,
+    )
+    fundamentals = np.fromiter(
+        (np.nan if record.fundamental_hz is None else record.fundamental_hz for record in records),
+        dtype=np.float64,
+        count=total,
+    )
+    detections = int(np.count_nonzero(detected))
 
     return {
         "total_files": float(total),
         "detections": float(detections),
-        "detection_rate": (detections / total) if total else 0.0,
-        "avg_confidence": avg_conf,
-        "avg_snr": avg_snr,
-        "avg_fundamental": avg_fund,
+        "detection_rate": detections / total,
+        "avg_confidence": float(confidences.mean()),
+        "avg_snr": _nanmean(snrs),
+        "avg_fundamental": _nanmean(fundamentals),
     }
 
 
+def _nanmean(values: np.ndarray) -> float:
+    present = values[~np.isnan(values)]
+    return float(present.mean()) if present.size else 0.0
+
+
 def _ensure_path(path: Path) -> Path:
     resolved = path.expanduser().resolve()
     if not resolved.exists():
@@ -103,6 +131,67 @@ def _row_for(
     return row
 
 
+# Per-process dataset entries, installed once by the pool initializer so combo tasks
+# do not re-pickle the file lists.
+_WORKER_ENTRIES: Dict[str, Optional[List]] = {}
+
+
+def _init_combo_worker(positive_entries: List, negative_entries: Optional[List]) -> None:
+    _WORKER_ENTRIES["positive"] = positive_entries
+    _WORKER_ENTRIES["negative"] = negative_entries
+
+
+def _combo_overrides(
+    names: Sequence[str],
+    combo: Tuple[float, ...],
+    constant_overrides: Dict[str, str],
+) -> Dict[str, str]:
+    overrides: Dict[str, str] = dict(constant_overrides)
+    overrides.update({name: _coerce_override(value) for name, value in zip(names, combo)})
+    return overrides
+
+
+def _run_one_combo(
+    overrides: Dict[str, str],
+    positive_root: Path,
+    negative_root: Optional[Path],
+    args: argparse.Namespace,
+    *,
+    workers: Optional[int] = 1,
+    show_progress: bool = False,
+) -> Tuple[Dict[str, float], Optional[Dict[str, float]]]:
+    positive_records = evaluate_dataset(
+        positive_root,
+        max_files=args.max_positive,
+        overrides=overrides,
+        save_reports=False,
+        show_progress=show_progress,
+        shuffle_seed=args.seed,
+        workers=workers,
+        chunksize=args.chunksize,
+        io_prefetch=args.io_prefetch,
+        entries=_WORKER_ENTRIES["positive"],
+    )
+    positive_summary = _summarize(positive_records)
+
+    negative_summary: Optional[Dict[str, float]] = None
+    if negative_root is not None:
+        negative_records = evaluate_dataset(
+            negative_root,
+            max_files=args.max_negative,
+            overrides=overrides,
+            save_reports=False,
+            show_progress=False,
+            shuffle_seed=args.seed,
+            workers=workers,
+            chunksize=args.chunksize,
+            io_prefetch=args.io_prefetch,
+            entries=_WORKER_ENTRIES["negative"],
+        )
+        negative_summary = _summarize(negative_records)
+    return positive_summary, negative_summary
+
+
 def run_sweep(args: argparse.Namespace) -> List[Dict[str, float | str | None]]:
     positive_root = _ensure_path(args.positive_root)
     negative_root = None
@@ -113,42 +202,72 @@ def run_sweep(args: argparse.Namespace) -> List[Dict[str, float | str | None]]:
             print(f"[warn] Negative dataset root '{args.negative_root}' not found; skipping negative sweep")
             negative_root = None
 
+    # Spectra only depend on the file and FFT settings, so persist them between sweep runs.
+    enable_disk_cache(None if args.no_cache else args.cache_dir)
+
     names, combos = _build_grid(args)
     if not combos:
         combos = [tuple()]
 
     constant_overrides = _parse_overrides(args.override)
 
-    results: List[Dict[str, float | str | None]] = []
-    for index, combo in enumerate(combos, start=1):
-        overrides: Dict[str, str] = dict(constant_overrides)
-        overrides.update({name: _coerce_override(value) for name, value in zip(names, combo)})
-
-        label = ", ".join(f"{key}={value}" for key, value in overrides.items()) or "(defaults)"
-        print(f"[{index}/{len(combos)}] Evaluating parameters: {label}")
-
-        positive_records = evaluate_dataset(
+    # Scan and parse each dataset tree once; every combo evaluates the same files.
+    positive_entries = _collect_entries(positive_root)
+    negative_entries = _collect_entries(negative_root) if negative_root is not None else None
+    _init_combo_worker(positive_entries, negative_entries)
+
+    all_overrides = [_combo_overrides(names, combo, constant_overrides) for combo in combos]
+    labels = [
+        ", ".join(f"{key}={value}" for key, value in overrides.items()) or "(defaults)"
+        for overrides in all_overrides
+    ]
+    jobs = max(1, args.jobs if args.jobs is not None else _default_jobs())
+    if jobs > 1:
+        # Each process already owns a core; keep native math libraries single-threaded.
+        os.environ.setdefault("OMP_NUM_THREADS", "1")
+
+    if len(combos) > 1 and jobs > 1:
+        # Parallelise across combos; each worker evaluates its combo serially so pools
+        # never nest. Results are consumed in submission order to keep the output stable.
+        pool = ProcessPoolExecutor(
+            max_workers=min(jobs, len(combos)),
+            initializer=_init_combo_worker,
+            initargs=(positive_entries, negative_entries),
+        )
+        with pool:
+            futures = [
+                pool.submit(_run_one_combo, overrides, positive_root, negative_root, args)
+                for overrides in all_overrides
+            ]
+            summaries = (future.result() for future in futures)
+            return _collect_rows(names, combos, labels, summaries)
+
+    # A single combo (or --jobs 1): parallelise across files instead.
+    summaries = (
+        _run_one_combo(
+            overrides,
             positive_root,
-            max_files=args.max_positive,
-            overrides=overrides,
-            save_reports=False,
+            negative_root,
+            args,
+            workers=jobs,
             show_progress=not args.quiet,
-            shuffle_seed=args.seed,
         )
-        positive_summary = _summarize(positive_records)
-
-        negative_summary: Optional[Dict[str, float]] = None
-        if negative_root is not None:
-            negative_records = evaluate_dataset(
-                negative_root,
-                max_files=args.max_negative,
-                overrides=overrides,
-                save_reports=False,
-                show_progress=False,
-                shuffle_seed=args.seed,
-            )
-            negative_summary = _summarize(negative_records)
+        for overrides in all_overrides
+    )
+    return _collect_rows(names, combos, labels, summaries)
 
+
+def _collect_rows(
+    names: Sequence[str],
+    combos: Sequence[Tuple[float, ...]],
+    labels: Sequence[str],
+    summaries: Iterable[Tuple[Dict[str, float], Optional[Dict[str, float]]]],
+) -> List[Dict[str, float | str | None]]:
+    results: List[Dict[str, float | str | None]] = []
+    for index, (combo, label, (positive_summary, negative_summary)) in enumerate(
+        zip(combos, labels, summaries), start=1
+    ):
+        print(f"[{index}/{len(combos)}] Evaluated parameters: {label}")
         row = _row_for(names, combo, positive_summary, negative_summary)
         row["overrides"] = label
         results.append(row)
@@ -172,11 +291,14 @@ def _write_results(path: Path, rows: List[Dict[str, float | str | None]]) -> Non
         return
 
     path.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = sorted({key for row in rows for key in row.keys()})
-    with path.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    # _row_for gives every combo the same keys, so the header comes from the first row;
+    # columns stay alphabetical as before.
+    fieldnames = sorted(rows[0])
+    row_for = itemgetter(*fieldnames)
+    with path.open("w", buffering=1 << 20, newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(fieldnames)
+        writer.writerows(row_for(row) for row in rows)
     print(f"[info] Results written to {path}")
 
 
@@ -241,6 +363,31 @@ def build_parser() -> argparse.ArgumentParser:
         help="Additional overrides applied to every sweep entry",
     )
     parser.add_argument("--output", type=Path, default=Path("reports/parameter_sweep.csv"), help="Output CSV path")
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help="Directory for the on-disk spectrum cache reused across sweep runs",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Disable the on-disk spectrum cache")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes (default: min(8, CPU count)); spread over combos, or over files for a single combo",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="Files handed to a worker per dispatch when parallelising over files",
+    )
+    parser.add_argument(
+        "--io-prefetch",
+        type=int,
+        default=None,
+        help="Files read ahead on threads while a worker evaluates serially",
+    )
     return parser
 
 
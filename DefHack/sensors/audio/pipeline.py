@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+import atexit
+import io
+import multiprocessing.util
+import os
+import queue
+import threading
+import warnings
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
-from .analysis import compute_fft, detect_bpf
+from ._cache import disk_cache
+from .analysis import BPFDetection, compute_fft, compute_fft_batch, detect_bpf, signal_energy_db
+from .analysis.signal_processing import _rfft_freqs
 from .config import AcousticConfig, load_config
 from .models import RotorSpecification, simulate_rotor_noise
 from .schemas import AcousticDroneSchema, build_no_detection_schema
@@ -30,48 +40,374 @@ def _resolve_signal(
         isinstance(sensor_input, str) and sensor_input.lower() == "simulate"
     ):
         spec = RotorSpecification(rpm=rpm, blades=blades, radius_m=rotor_radius_m)
-        _, signal, sim_meta = simulate_rotor_noise(duration_s, config, spec=spec)
+        # The simulator synthesises straight into this float32 buffer, the dtype the FFT
+        # consumes, so there is no float64 intermediate or conversion copy.
+        buffer = np.empty(int(config.sampling_rate * duration_s), dtype=np.float32)
+        _, signal, sim_meta = simulate_rotor_noise(duration_s, config, spec=spec, out=buffer)
         sim_meta.update({"source": "simulation"})
         return config.sampling_rate, signal, sim_meta
 
     if isinstance(sensor_input, np.ndarray):
         sr = float(sample_rate or config.sampling_rate)
-        return sr, sensor_input.astype(np.float32), {"source": "array"}
+        # No-op for float32 C-contiguous frames (the streaming case); one converting pass otherwise.
+        return sr, np.ascontiguousarray(sensor_input, dtype=np.float32), {"source": "array"}
 
     if isinstance(sensor_input, (str, Path)):
-        sr, signal = load_wav(sensor_input)
-        return sr, signal.astype(np.float32), {"source": "file", "path": str(Path(sensor_input).resolve())}
+        sr, signal = load_wav(sensor_input)  # already contiguous float32
+        return sr, signal, {"source": "file", "path": str(Path(sensor_input).resolve())}
 
     raise TypeError(
         "sensor_input must be None, a numpy array, or a path to a WAV file"
     )
 
 
-def _write_report(report_path: Path, schema: AcousticDroneSchema) -> Path:
-    report_path.parent.mkdir(parents=True, exist_ok=True)
+@disk_cache
+def _file_magnitude(path: str, mtime_ns: int, fft_size: int, window: str) -> Tuple[float, np.ndarray]:
+    sr, signal = load_wav(path)
+    _, magnitude = compute_fft(signal, sr, fft_size=fft_size, window=window)
+    return sr, magnitude
+
+
+# In-process LRU of file spectra in front of the (opt-in) disk cache. Keyed only on what
+# shapes the spectrum, so detector-only overrides (prominence, band limits, harmonic
+# count) reuse it; the mtime invalidates edited files.
+_SpectrumKey = Tuple[str, int, int, str]
+_SPECTRUM_MEMO_SIZE = 4096
+_SPECTRUM_MEMO: "OrderedDict[_SpectrumKey, Tuple[float, np.ndarray]]" = OrderedDict()
+_SPECTRUM_MEMO_LOCK = threading.Lock()
+
+
+def _spectrum_key(path: Path, config: AcousticConfig) -> _SpectrumKey:
+    return (str(path), path.stat().st_mtime_ns, config.fft_size, config.window)
+
+
+def _remember_magnitude(key: _SpectrumKey, sr: float, magnitude: np.ndarray) -> Tuple[float, np.ndarray]:
+    magnitude.setflags(write=False)
+    with _SPECTRUM_MEMO_LOCK:
+        _SPECTRUM_MEMO[key] = (sr, magnitude)
+        _SPECTRUM_MEMO.move_to_end(key)
+        if len(_SPECTRUM_MEMO) > _SPECTRUM_MEMO_SIZE:
+            _SPECTRUM_MEMO.popitem(last=False)
+    return sr, magnitude
+
+
+def _lookup_magnitude(key: _SpectrumKey) -> Optional[Tuple[float, np.ndarray]]:
+    """Memoised or disk-cached ``(sr, magnitude)`` for ``key``; ``None`` means compute it."""
+    with _SPECTRUM_MEMO_LOCK:
+        hit = _SPECTRUM_MEMO.get(key)
+        if hit is not None:
+            _SPECTRUM_MEMO.move_to_end(key)
+            return hit
+    stored = _file_magnitude.lookup(*key)
+    return None if stored is None else _remember_magnitude(key, *stored)
+
+
+def _cached_file_magnitude(key: _SpectrumKey, raw_bytes: bytes | None = None) -> Tuple[float, np.ndarray]:
+    hit = _lookup_magnitude(key)
+    if hit is not None:
+        return hit
+    if raw_bytes is None:
+        return _remember_magnitude(key, *_file_magnitude(*key))
+    # A miss the caller already read from disk (prefetch): decode it from memory.
+    sr, signal = load_wav(io.BytesIO(raw_bytes))
+    _, magnitude = compute_fft(signal, sr, fft_size=key[2], window=key[3])
+    _file_magnitude.store((sr, magnitude), *key)
+    return _remember_magnitude(key, sr, magnitude)
+
+
+def _spectrum_cached(path: str | Path, config: AcousticConfig) -> bool:
+    """Whether the spectrum for ``path`` can be served without reading the file."""
+    return _lookup_magnitude(_spectrum_key(Path(path).resolve(), config)) is not None
+
+
+def _freq_for(sr: float, config: AcousticConfig) -> np.ndarray:
+    return config.freq_bins if sr == config.sampling_rate else _rfft_freqs(config.fft_size, sr)
+
+
+def _file_spectrum(
+    path: Path, config: AcousticConfig, raw_bytes: bytes | None = None
+) -> Tuple[float, np.ndarray, np.ndarray]:
+    sr, magnitude = _cached_file_magnitude(_spectrum_key(path, config), raw_bytes)
+    return sr, _freq_for(sr, config), magnitude
+
+
+def _format_report(schema: AcousticDroneSchema) -> bytes:
     metadata = schema.metadata
-    lines = [
-        f"Timestamp: {schema.Timestamp}",
-        f"Source: {metadata.get('source', 'unknown')}",
-        f"Description: {schema.summary}",
-        f"Confidence: {metadata.get('confidence_pct', 0)}%",
-        f"Peak (dB): {metadata.get('peak_db', 'n/a')}",
-        f"Noise floor (dB): {metadata.get('noise_floor_db', 'n/a')}",
-    ]
-    if metadata.get("harmonics"):
-        lines.append("Harmonics:")
-        for harmonic in metadata["harmonics"]:
-            freq = harmonic["frequency_hz"]
-            amplitude = harmonic["amplitude_db"]
-            order = int(harmonic["order"])
-            lines.append(f"  - Order {order}: {freq:.1f} Hz @ {amplitude:.1f} dB")
+    text = (
+        f"Timestamp: {schema.Timestamp}\n"
+        f"Source: {metadata.get('source', 'unknown')}\n"
+        f"Description: {schema.summary}\n"
+        f"Confidence: {metadata.get('confidence_pct', 0)}%\n"
+        f"Peak (dB): {metadata.get('peak_db', 'n/a')}\n"
+        f"Noise floor (dB): {metadata.get('noise_floor_db', 'n/a')}\n"
+    )
+    harmonics = metadata.get("harmonics")
+    if harmonics:
+        text += "Harmonics:\n" + "".join(
+            f"  - Order {int(harmonic['order'])}: {harmonic['frequency_hz']:.1f} Hz "
+            f"@ {harmonic['amplitude_db']:.1f} dB\n"
+            for harmonic in harmonics
+        )
     if metadata.get("narrative"):
-        lines.append("")
-        lines.append(metadata["narrative"])
-    report_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        text += f"\n{metadata['narrative']}\n"
+    # Encoded once here so the writer thread does a plain binary write.
+    return text.encode("utf-8")
+
+
+# Report files are written by one background thread so save_report does not block
+# detection on disk latency. The text is formatted up front, so the writer never
+# touches a schema the caller may still be mutating. Callers that read a report back
+# (or need to know it was written) call flush_reports() first.
+_REPORT_QUEUE: queue.SimpleQueue[Tuple[Path, bytes] | None] = queue.SimpleQueue()
+_REPORT_WRITER: threading.Thread | None = None
+_REPORT_WRITER_LOCK = threading.Lock()
+_REPORT_ERRORS: List[OSError] = []
+_REPORT_FINALIZER_PID: int | None = None
+
+
+def _report_worker() -> None:
+    while True:
+        item = _REPORT_QUEUE.get()
+        if item is None:
+            return
+        report_path, payload = item
+        try:
+            report_path.parent.mkdir(parents=True, exist_ok=True)
+            report_path.write_bytes(payload)
+        except OSError as exc:
+            _REPORT_ERRORS.append(exc)
+            warnings.warn(f"Failed to write acoustic report {report_path}: {exc}", RuntimeWarning)
+
+
+def flush_reports(*, raise_errors: bool = False) -> None:
+    """Block until every queued report has been written.
+
+    Failed writes are warned about as they happen; with ``raise_errors`` the first
+    failure since the previous flush is also re-raised here.
+    """
+    global _REPORT_WRITER
+    with _REPORT_WRITER_LOCK:
+        writer = _REPORT_WRITER
+        if writer is not None:
+            _REPORT_QUEUE.put(None)
+            writer.join()
+            _REPORT_WRITER = None
+        failures = list(_REPORT_ERRORS)
+        _REPORT_ERRORS.clear()
+    if raise_errors and failures:
+        raise failures[0]
+
+
+def _enqueue_report(report_path: Path, schema: AcousticDroneSchema) -> Path:
+    global _REPORT_WRITER, _REPORT_FINALIZER_PID
+    payload = _format_report(schema)
+    with _REPORT_WRITER_LOCK:
+        if _REPORT_WRITER is None:
+            _REPORT_WRITER = threading.Thread(target=_report_worker, name="acoustic-report-writer", daemon=True)
+            _REPORT_WRITER.start()
+            # multiprocessing clears inherited finalizers in its children, so each
+            # process registers its own.
+            if _REPORT_FINALIZER_PID != os.getpid():
+                multiprocessing.util.Finalize(None, flush_reports, exitpriority=10)
+                _REPORT_FINALIZER_PID = os.getpid()
+        _REPORT_QUEUE.put((report_path, payload))
     return report_path
 
 
+def _reset_report_writer() -> None:
+    # A forked child inherits the writer's state but not its thread (and possibly a
+    # held lock or the parent's pending reports); start over so the child's reports
+    # get a writer of their own.
+    global _REPORT_QUEUE, _REPORT_WRITER, _REPORT_WRITER_LOCK, _REPORT_ERRORS
+    _REPORT_QUEUE = queue.SimpleQueue()
+    _REPORT_WRITER = None
+    _REPORT_WRITER_LOCK = threading.Lock()
+    _REPORT_ERRORS = []
+
+
+# atexit covers the main process; multiprocessing pool workers skip atexit but run
+# their util finalizers on shutdown.
+atexit.register(flush_reports)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_report_writer)
+
+
+class Detector:
+    """Acoustic BPF detector bound to one configuration.
+
+    Build it once and call :meth:`analyze` per input; the config-derived state (window,
+    frequency bins, search band, config dict) is resolved a single time up front.
+    With ``save_report`` the report is written in the background: ``report_path`` in
+    the metadata is the destination, which exists once :func:`flush_reports` returns.
+    """
+
+    def __init__(self, config: AcousticConfig | None = None) -> None:
+        self.config = config if config is not None else load_config()
+        self._config_dict = self.config.to_dict()
+
+    def analyze(
+        self,
+        sensor_input: Any = None,
+        *,
+        sample_rate: float | None = None,
+        duration_s: float = 2.5,
+        rpm: float | None = None,
+        blades: int | None = None,
+        rotor_radius_m: float = 0.165,
+        place: str = "UNKNOWN",
+        save_report: bool = False,
+        report_path: str | Path | None = None,
+        raw_bytes: bytes | None = None,
+    ) -> AcousticDroneSchema:
+        config = self.config
+        rpm = rpm if rpm is not None else config.default_rpm
+        blades = blades if blades is not None else config.default_blades
+
+        is_file = isinstance(sensor_input, (str, Path)) and not (
+            isinstance(sensor_input, str) and sensor_input.lower() == "simulate"
+        )
+        if is_file:
+            wav_path = Path(sensor_input).resolve()
+            # Cached spectra win over prefetched raw_bytes, which are only decoded on a miss.
+            sr, freq, magnitude = _file_spectrum(wav_path, config, raw_bytes)
+            signal_meta: Dict[str, Any] = {"source": "file", "path": str(wav_path)}
+        else:
+            sr, signal, signal_meta = _resolve_signal(
+                sensor_input,
+                config,
+                sample_rate=sample_rate,
+                duration_s=duration_s,
+                rpm=rpm,
+                blades=blades,
+                rotor_radius_m=rotor_radius_m,
+            )
+            energy_db = signal_energy_db(signal)
+            if energy_db < config.energy_gate_db:
+                # Near-silent frame (the common case when monitoring): skip FFT and peak search.
+                detection = BPFDetection(
+                    None, [], -120.0, -120.0, 0.0, f"Signal energy {energy_db:.1f} dBFS below gate"
+                )
+                return self._report(
+                    detection,
+                    signal_meta,
+                    place=place,
+                    save_report=save_report,
+                    report_path=report_path,
+                )
+            freq, magnitude = compute_fft(signal, sr, config=config)
+        return self._report(
+            detect_bpf(freq, magnitude, config=config),
+            signal_meta,
+            place=place,
+            save_report=save_report,
+            report_path=report_path,
+        )
+
+    def analyze_batch(
+        self,
+        paths: Sequence[str | Path],
+        *,
+        places: Sequence[str] | None = None,
+        raw_bytes: Sequence[bytes | None] | None = None,
+        save_report: bool = False,
+    ) -> List[AcousticDroneSchema]:
+        """Analyse several WAV files, sharing one FFT call per sample rate.
+
+        Spectra already in the in-process or disk cache are reused; only the misses are
+        decoded (from ``raw_bytes``, each file's already-read contents, when given) and
+        pushed through the batched FFT, and their spectra are cached in turn.
+        """
+        config = self.config
+        wav_paths = [Path(path).resolve() for path in paths]
+        keys = [_spectrum_key(wav_path, config) for wav_path in wav_paths]
+        cached: List[Optional[Tuple[float, np.ndarray]]] = [_lookup_magnitude(key) for key in keys]
+
+        by_rate: Dict[float, List[Tuple[int, np.ndarray]]] = {}
+        for index, hit in enumerate(cached):
+            if hit is not None:
+                continue
+            data = raw_bytes[index] if raw_bytes is not None else None
+            sr, signal = load_wav(io.BytesIO(data) if data is not None else wav_paths[index])
+            by_rate.setdefault(sr, []).append((index, signal))
+
+        for sr, items in by_rate.items():
+            _, magnitudes = compute_fft_batch([signal for _, signal in items], sr, config=config)
+            for (index, _), magnitude in zip(items, magnitudes):
+                _file_magnitude.store((sr, magnitude), *keys[index])
+                cached[index] = _remember_magnitude(keys[index], sr, magnitude)
+
+        spectra = [(_freq_for(sr, config), magnitude) for sr, magnitude in cached]  # type: ignore[misc]
+        places = places or ["UNKNOWN"] * len(wav_paths)
+        return [
+            self._report(
+                detect_bpf(freq, magnitude, config=config),
+                {"source": "file", "path": str(wav_path)},
+                place=place,
+                save_report=save_report,
+            )
+            for wav_path, (freq, magnitude), place in zip(wav_paths, spectra, places)
+        ]
+
+    def _report(
+        self,
+        detection: BPFDetection,
+        signal_meta: Dict[str, Any],
+        *,
+        place: str,
+        save_report: bool,
+        report_path: str | Path | None = None,
+    ) -> AcousticDroneSchema:
+        now = datetime.now(tz=timezone.utc)
+        noise_floor_db = detection.noise_floor_db
+        peak_db = detection.peak_db
+        snr = peak_db - noise_floor_db
+        confidence_pct = int(round(detection.confidence * 100))
+        confidence_pct = max(0, min(100, confidence_pct))
+        metadata: Dict[str, Any] = {
+            **signal_meta,
+            "config": dict(self._config_dict),
+            "confidence_pct": confidence_pct,
+            "harmonics": detection.harmonics,
+            "harmonic_count": len(detection.harmonics),
+            "fundamental_hz": detection.fundamental_hz,
+            "peak_db": peak_db,
+            "noise_floor_db": noise_floor_db,
+            "snr_db": snr,
+            "description": detection.description,
+        }
+
+        if detection.fundamental_hz is None:
+            schema = build_no_detection_schema(metadata.get("source", "unknown"), timestamp=now)
+            base_description = schema.summary
+            base_narrative = schema.metadata.get("narrative")
+            schema.metadata.update(metadata)
+            schema.metadata["description"] = base_description
+            if base_narrative:
+                schema.metadata.setdefault("narrative", base_narrative)
+        else:
+            narrative = (
+                f"Detected blade-pass frequency at {detection.fundamental_hz:.1f} Hz "
+                f"with {len(detection.harmonics)} harmonics. Estimated SNR {snr:.1f} dB."
+            )
+            metadata["narrative"] = narrative
+            schema = AcousticDroneSchema(
+                timestamp=now,
+                place=place,
+                harmonic_count=len(detection.harmonics),
+                detection_type="RotorAcousticDetection",
+                confidence=confidence_pct,
+                produced_by="AcousticBPF-1.0",
+                metadata=metadata,
+            )
+
+        if save_report:
+            destination = Path(report_path) if report_path else _REPORT_DIR / f"acoustic_report_{now:%Y%m%dT%H%M%SZ}.txt"
+            written = _enqueue_report(destination, schema)
+            schema.metadata["report_path"] = str(written)
+
+        return schema
+
+
 def analyze_audio(
     sensor_input: Any = None,
     *,
@@ -85,87 +421,22 @@ def analyze_audio(
     place: str = "UNKNOWN",
     save_report: bool = False,
     report_path: str | Path | None = None,
+    raw_bytes: bytes | None = None,
 ) -> AcousticDroneSchema:
-    config = load_config(config_path, overrides)
-    rpm = rpm if rpm is not None else config.default_rpm
-    blades = blades if blades is not None else config.default_blades
-
-    sr, signal, signal_meta = _resolve_signal(
+    detector = Detector(load_config(config_path, overrides))
+    return detector.analyze(
         sensor_input,
-        config,
         sample_rate=sample_rate,
         duration_s=duration_s,
         rpm=rpm,
         blades=blades,
         rotor_radius_m=rotor_radius_m,
+        place=place,
+        save_report=save_report,
+        report_path=report_path,
+        raw_bytes=raw_bytes,
     )
 
-    freq, magnitude = compute_fft(
-        signal,
-        sr,
-        fft_size=config.fft_size,
-        window=config.window,
-    )
-
-    detection = detect_bpf(
-        freq,
-        magnitude,
-        min_hz=config.min_bpf_hz,
-        max_hz=config.max_bpf_hz,
-        prominence_ratio=config.prominence_ratio,
-        expected_harmonics=config.num_harmonics,
-    )
-
-    now = datetime.now(tz=timezone.utc)
-    noise_floor_db = detection.noise_floor_db
-    peak_db = detection.peak_db
-    snr = peak_db - noise_floor_db
-    confidence_pct = int(round(detection.confidence * 100))
-    confidence_pct = max(0, min(100, confidence_pct))
-    metadata: Dict[str, Any] = {
-        **signal_meta,
-        "config": config.to_dict(),
-        "confidence_pct": confidence_pct,
-        "harmonics": detection.harmonics,
-        "harmonic_count": len(detection.harmonics),
-        "fundamental_hz": detection.fundamental_hz,
-        "peak_db": peak_db,
-        "noise_floor_db": noise_floor_db,
-        "snr_db": snr,
-        "description": detection.description,
-    }
-
-    if detection.fundamental_hz is None:
-        schema = build_no_detection_schema(metadata.get("source", "unknown"))
-        base_description = schema.summary
-        base_narrative = schema.metadata.get("narrative")
-        schema.metadata.update(metadata)
-        schema.metadata["description"] = base_description
-        if base_narrative:
-            schema.metadata.setdefault("narrative", base_narrative)
-    else:
-        narrative = (
-            f"Detected blade-pass frequency at {detection.fundamental_hz:.1f} Hz "
-            f"with {len(detection.harmonics)} harmonics. Estimated SNR {snr:.1f} dB."
-        )
-        metadata["narrative"] = narrative
-        schema = AcousticDroneSchema(
-            timestamp=now,
-            place=place,
-            harmonic_count=len(detection.harmonics),
-            detection_type="RotorAcousticDetection",
-            confidence=confidence_pct,
-            produced_by="AcousticBPF-1.0",
-            metadata=metadata,
-        )
-
-    if save_report:
-        destination = Path(report_path) if report_path else _REPORT_DIR / f"acoustic_report_{now:%Y%m%dT%H%M%SZ}.txt"
-        written = _write_report(destination, schema)
-        schema.metadata["report_path"] = str(written)
-
-    return schema
-
 
 def register_with_sensor_schema(sensor_schema_cls) -> None:
     sensor_schema_cls.register_algorithm(_ALGORITHM_NAME, lambda sensor_input, **kwargs: analyze_audio(sensor_input, **kwargs))
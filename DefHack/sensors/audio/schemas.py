@@ -31,6 +31,8 @@ class AcousticDroneSchema(SensorSchema):
             Produced_by=produced_by,
         )
         self.metadata = metadata
+        # Keep the datetime so detection_timestamp needs no ISO round-trip.
+        self._detected_at = timestamp
 
     @property
     def summary(self) -> str:
@@ -38,6 +40,9 @@ class AcousticDroneSchema(SensorSchema):
 
     @property
     def detection_timestamp(self) -> datetime:
+        detected_at = getattr(self, "_detected_at", None)
+        if detected_at is not None:
+            return detected_at
         raw = self.Timestamp
         if isinstance(raw, datetime):
             return raw
@@ -70,8 +75,8 @@ class AcousticDroneSchema(SensorSchema):
         )
 
 
-def build_no_detection_schema(source: str) -> AcousticDroneSchema:
-    now = datetime.now(tz=timezone.utc)
+def build_no_detection_schema(source: str, *, timestamp: datetime | None = None) -> AcousticDroneSchema:
+    now = timestamp if timestamp is not None else datetime.now(tz=timezone.utc)
     metadata = {
         "source": source,
         "description": "No rotor signature detected",
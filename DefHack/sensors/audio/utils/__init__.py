@@ -1,8 +1,9 @@
-from .io_utils import load_wav, write_wav
+from .io_utils import load_wav, map_wav, write_wav
 from .plotting import plot_spectrum, stem_plot
 
 __all__ = [
     "load_wav",
+    "map_wav",
     "write_wav",
     "plot_spectrum",
     "stem_plot",
@@ -1,40 +1,174 @@
 from __future__ import annotations
 
+import os
+import struct
 import wave
 from pathlib import Path
-from typing import Tuple
+from typing import BinaryIO, Optional, Tuple
 
 import numpy as np
 
+try:  # pragma: no cover - optional dependency
+    import soundfile
+except ImportError:  # pragma: no cover - fall back to the stdlib wave reader
+    soundfile = None
+
 
 _INT16_MAX = float(np.iinfo(np.int16).max)
+# Frames per read: 32k stereo PCM16 frames is 128 KiB raw plus 128 KiB of float32 output.
+_BLOCK_FRAMES = 32_768
+_WAVE_FORMAT_PCM = 0x0001
+# libsndfile scales PCM by 2**(bits-1); the wave path divides by the dtype max. Rescale
+# so both readers hand the detector identical samples.
+_SOUNDFILE_RESCALE = {
+    "PCM_16": 32_768.0 / _INT16_MAX,
+    "PCM_32": 2_147_483_648.0 / float(np.iinfo(np.int32).max),
+}
+
+
+def _load_wav_soundfile(source: str | BinaryIO) -> Tuple[float, np.ndarray]:
+    with soundfile.SoundFile(source) as sound_file:
+        sample_rate = sound_file.samplerate
+        subtype = sound_file.subtype
+        audio = sound_file.read(dtype="float32", always_2d=False)
+    if audio.ndim == 2:
+        audio = audio.mean(axis=1, dtype=np.float32)
+    scale = _SOUNDFILE_RESCALE.get(subtype)
+    if scale is not None:
+        audio *= np.float32(scale)
+    return float(sample_rate), audio
+
+
+def _pcm_layout(path: str) -> Optional[Tuple[int, int, np.dtype, int, int]]:
+    """Return ``(sample_rate, channels, dtype, data_offset, frames)`` for plain PCM16/32 WAVs."""
+    try:
+        with open(path, "rb") as handle:
+            header = handle.read(12)
+            if len(header) < 12 or header[:4] != b"RIFF" or header[8:] != b"WAVE":
+                return None
+            fmt = None
+            while True:
+                chunk = handle.read(8)
+                if len(chunk) < 8:
+                    return None
+                chunk_id, chunk_size = chunk[:4], struct.unpack("<I", chunk[4:])[0]
+                if chunk_id == b"fmt ":
+                    fmt = handle.read(chunk_size)
+                    if chunk_size % 2:
+                        handle.seek(1, os.SEEK_CUR)
+                elif chunk_id == b"data":
+                    data_offset = handle.tell()
+                    break
+                else:
+                    handle.seek(chunk_size + chunk_size % 2, os.SEEK_CUR)
+            file_size = os.fstat(handle.fileno()).st_size
+    except OSError:
+        return None
+    if fmt is None or len(fmt) < 16:
+        return None
+    audio_format, channels, sample_rate, _byte_rate, _block_align, bits = struct.unpack("<HHIIHH", fmt[:16])
+    if audio_format != _WAVE_FORMAT_PCM or bits not in (16, 32) or channels < 1:
+        return None
+    dtype = np.dtype("<i2" if bits == 16 else "<i4")
+    frame_bytes = dtype.itemsize * channels
+    # A truncated file can claim more data than it holds; map only what is there.
+    data_size = min(chunk_size, file_size - data_offset)
+    return sample_rate, channels, dtype, data_offset, max(data_size, 0) // frame_bytes
+
+
+def _map_pcm(path: str) -> Optional[Tuple[float, np.ndarray]]:
+    layout = _pcm_layout(path)
+    if layout is None:
+        return None
+    sample_rate, channels, dtype, data_offset, frames = layout
+    if frames == 0:
+        return float(sample_rate), np.empty((0, channels), dtype=dtype)
+    pcm = np.memmap(path, dtype=dtype, mode="r", offset=data_offset, shape=(frames, channels))
+    return float(sample_rate), pcm
+
+
+def map_wav(path: str | Path) -> Tuple[float, np.ndarray]:
+    """Memory-map the PCM payload of a 16/32-bit PCM WAV as a read-only ``(frames, channels)`` array.
+
+    Nothing is read up front; the OS pages samples in as they are touched and shares
+    them between processes mapping the same file.
+    """
+    mapped = _map_pcm(str(Path(path)))
+    if mapped is None:
+        raise ValueError(f"{path} is not a 16/32-bit PCM WAV file")
+    return mapped
+
+
+def _decode_block(raw: np.ndarray, out: np.ndarray, divisor: np.float32) -> None:
+    # Channels are summed exactly in integers; folding the channel count into the
+    # divisor turns that sum into the mean in the same fused divide that scales it.
+    if raw.ndim == 2:
+        raw = raw[:, 0] if raw.shape[1] == 1 else raw.sum(axis=1, dtype=np.int64)
+    np.divide(raw, divisor, out=out, dtype=np.float32)
+
+
+def _divisor(dtype: np.dtype, channels: int) -> np.float32:
+    scale = _INT16_MAX if dtype == np.int16 else float(np.iinfo(dtype).max)
+    return np.float32(scale * channels)
 
 
-def load_wav(path: str | Path) -> Tuple[float, np.ndarray]:
-    file_path = Path(path)
-    with wave.open(str(file_path), "rb") as wav_file:
+def load_wav(path: str | Path | BinaryIO) -> Tuple[float, np.ndarray]:
+    source = path if hasattr(path, "read") else str(Path(path))
+    mapped = _map_pcm(source) if isinstance(source, str) else None
+    if mapped is not None:
+        # Plain PCM on disk: decode straight out of the page cache, skipping the
+        # per-block bytes copies readframes() would make.
+        sample_rate, pcm = mapped
+        divisor = _divisor(pcm.dtype, pcm.shape[1])
+        audio = np.empty(pcm.shape[0], dtype=np.float32)
+        for offset in range(0, pcm.shape[0], _BLOCK_FRAMES):
+            block = pcm[offset : offset + _BLOCK_FRAMES]
+            _decode_block(block, audio[offset : offset + block.shape[0]], divisor)
+        return sample_rate, audio
+    if soundfile is not None:
+        # libsndfile decodes straight to float32 in one pass.
+        return _load_wav_soundfile(source)
+    with wave.open(source, "rb") as wav_file:
         sample_rate = wav_file.getframerate()
         frame_count = wav_file.getnframes()
         channels = wav_file.getnchannels()
-        frames = wav_file.readframes(frame_count)
-        dtype = np.int16 if wav_file.getsampwidth() == 2 else np.int32
-        audio = np.frombuffer(frames, dtype=dtype).astype(np.float32)
-        if channels > 1:
-            audio = audio.reshape(-1, channels).mean(axis=1)
-        if dtype == np.int16:
-            audio /= _INT16_MAX
-        else:
-            audio /= float(np.iinfo(dtype).max)
+        dtype = np.dtype(np.int16 if wav_file.getsampwidth() == 2 else np.int32)
+        divisor = _divisor(dtype, channels)
+        audio = np.empty(frame_count, dtype=np.float32)
+        offset = 0
+        # Decode fixed blocks straight into the preallocated output, so the raw bytes are
+        # never held for the whole file and each block stays cache-resident.
+        while offset < frame_count:
+            chunk = wav_file.readframes(min(_BLOCK_FRAMES, frame_count - offset))
+            if not chunk:
+                break
+            raw = np.frombuffer(chunk, dtype=dtype).reshape(-1, channels)
+            count = raw.shape[0]
+            _decode_block(raw, audio[offset : offset + count], divisor)
+            offset += count
+        if offset < frame_count:
+            # The header overstated the length (truncated file): keep what was decoded.
+            audio = audio[:offset]
     return float(sample_rate), audio
 
 
 def write_wav(path: str | Path, sample_rate: float, signal: np.ndarray) -> None:
     out_path = Path(path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    int_signal = np.clip(signal, -1.0, 1.0) * _INT16_MAX
-    int_signal = int_signal.astype(np.int16)
+    signal = np.asarray(signal).reshape(-1)
+    work_dtype = signal.dtype if np.issubdtype(signal.dtype, np.floating) else np.float64
+    int_signal = np.empty(signal.shape[0], dtype=np.int16)
+    scratch = np.empty(min(_BLOCK_FRAMES, signal.shape[0]), dtype=work_dtype)
+    # Clip, scale and truncate block by block through one cache-resident scratch
+    # buffer, so the only full-length allocation is the int16 output itself.
+    for start in range(0, signal.shape[0], _BLOCK_FRAMES):
+        block = signal[start : start + _BLOCK_FRAMES]
+        work = scratch[: block.shape[0]]
+        np.clip(block, -1.0, 1.0, out=work)
+        np.multiply(work, _INT16_MAX, out=work)
+        np.copyto(int_signal[start : start + block.shape[0]], work, casting="unsafe")
     with wave.open(str(out_path), "wb") as wav_file:
         wav_file.setnchannels(1)
         wav_file.setsampwidth(2)
         wav_file.setframerate(int(sample_rate))
-        wav_file.writeframes(int_signal.tobytes())
+        wav_file.writeframes(int_signal)
@@ -9,10 +9,27 @@ try:  # pragma: no cover - optional dependency
 except ImportError:  # pragma: no cover - gracefully degrade
     plt = None
 
+# Beyond this many points a line plot is sub-pixel anyway; decimate before rendering.
+_MAX_PLOT_POINTS = 20_000
+
+
+def _as_float_array(values: Iterable[float]) -> np.ndarray:
+    # Arrays (the usual detect_bpf output, often float32) pass through without a copy;
+    # matplotlib plots any float dtype.
+    if isinstance(values, np.ndarray):
+        return values
+    return np.fromiter(values, dtype=np.float64)
+
 
 def plot_spectrum(freq: np.ndarray, magnitude: np.ndarray, *, title: str = "Spectrum") -> None:
     if plt is None:
         raise RuntimeError("matplotlib is not installed; plotting is unavailable")
+    freq = np.asarray(freq)
+    magnitude = np.asarray(magnitude)
+    if magnitude.size > _MAX_PLOT_POINTS:
+        idx = np.linspace(0, magnitude.size - 1, _MAX_PLOT_POINTS).astype(np.intp)
+        freq = freq[idx]
+        magnitude = magnitude[idx]
     plt.figure(figsize=(10, 4))
     plt.plot(freq, magnitude)
     plt.xlabel("Frequency [Hz]")
@@ -26,10 +43,11 @@ def plot_spectrum(freq: np.ndarray, magnitude: np.ndarray, *, title: str = "Spec
 def stem_plot(freqs: Iterable[float], values: Iterable[float], *, title: str = "BPF Harmonics") -> None:
     if plt is None:
         raise RuntimeError("matplotlib is not installed; plotting is unavailable")
-    freqs_list = list(freqs)
-    values_list = list(values)
+    freqs_arr = _as_float_array(freqs)
+    values_arr = _as_float_array(values)
     plt.figure(figsize=(8, 4))
-    plt.stem(freqs_list, values_list, use_line_collection=True)
+    # LineCollection is the default since Matplotlib 3.3; the kwarg is gone in 3.8.
+    plt.stem(freqs_arr, values_arr)
     plt.xlabel("Frequency [Hz]")
     plt.ylabel("Amplitude [dB]")
     plt.title(title)
@@ -1,17 +1,25 @@
 """Image sensor pipeline package."""
 
+from importlib import import_module
+
 __all__ = []
 
-try:  # pragma: no cover - optional legacy pipeline components
-    from .models import ImageIntelSchema  # type: ignore[attr-defined]
-except ModuleNotFoundError:  # pragma: no cover - legacy pipeline not available
-    ImageIntelSchema = None  # type: ignore[assignment]
-else:  # pragma: no cover - executed when legacy pipeline present
-    __all__.append("ImageIntelSchema")
+# Optional legacy pipeline components. Resolving them means importing the CLI
+# module (and with it the YOLOv8 stack), so defer that until something actually
+# asks for them (PEP 562); missing components resolve to ``None``.
+_LEGACY_ATTRS = {
+    "ImageIntelSchema": ".models",
+    "soldier_recognition_pipeline": ".__main__",
+}
+
 
-try:  # pragma: no cover - optional legacy pipeline components
-    from .__main__ import soldier_recognition_pipeline  # type: ignore[attr-defined]
-except (ModuleNotFoundError, ImportError):  # pragma: no cover - legacy pipeline not available
-    soldier_recognition_pipeline = None  # type: ignore[assignment]
-else:  # pragma: no cover - executed when legacy pipeline present
-    __all__.append("soldier_recognition_pipeline")
+def __getattr__(name: str):
+    module_name = _LEGACY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:  # pragma: no cover - optional legacy pipeline components
+        value = getattr(import_module(module_name, __name__), name)
+    except (ImportError, AttributeError):  # pragma: no cover - legacy pipeline not available
+        value = None
+    globals()[name] = value
+    return value
@@ -4,15 +4,25 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Sequence
+from typing import List, Sequence, Tuple
 
 from .yolov8_person_pipeline import Yolov8PersonCaptionSchema
 
 IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff"}
 
 
+def _positive_int(value: str) -> int:
+	number = int(value)
+	if number < 1:
+		raise argparse.ArgumentTypeError("must be a positive integer")
+	return number
+
+
 def parse_args(argv: Sequence[str]) -> argparse.Namespace:
 	parser = argparse.ArgumentParser(
 		prog="python -m DefHack.sensors.images",
@@ -38,6 +48,12 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
 		default=0.25,
 		help="Detection confidence threshold between 0 and 1 (default: 0.25).",
 	)
+	parser.add_argument(
+		"--batch-size",
+		type=_positive_int,
+		default=8,
+		help="Number of images per detector forward pass (default: 8).",
+	)
 	parser.add_argument(
 		"--mgrs",
 		default="UNKNOWN",
@@ -100,8 +116,24 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
 	return parser.parse_args(list(argv))
 
 
+_SCAN_WORKERS = 8
+
+
+def _scan_directory(directory: Path) -> List[Path]:
+	# DirEntry.is_file() reuses the type scandir already read, so this costs one
+	# directory listing instead of a stat per child.
+	with os.scandir(directory) as entries:
+		names = sorted(
+			entry.name
+			for entry in entries
+			if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_SUFFIXES
+		)
+	return [directory / name for name in names]
+
+
 def _resolve_image_paths(sources: Sequence[Path]) -> List[Path]:
-	images: List[Path] = []
+	resolved: List[Tuple[bool, Path]] = []
+	directories: List[Path] = []
 	missing: List[Path] = []
 
 	for source in sources:
@@ -112,18 +144,30 @@ def _resolve_image_paths(sources: Sequence[Path]) -> List[Path]:
 			continue
 		if path.is_file():
 			if path.suffix.lower() in IMAGE_SUFFIXES:
-				images.append(path)
+				resolved.append((False, path))
 			else:
 				print(f"[warning] Skipping unsupported file: {path}", file=sys.stderr)
 			continue
-		for child in sorted(path.iterdir()):
-			if child.is_file() and child.suffix.lower() in IMAGE_SUFFIXES:
-				images.append(child)
+		directories.append(path)
+		resolved.append((True, path))
 
 	if missing:
 		missing_str = ", ".join(str(item) for item in missing)
 		raise FileNotFoundError(f"No such file or directory: {missing_str}")
 
+	# Listing latency (network shares, large folders) overlaps across sources.
+	if len(directories) > 1:
+		with ThreadPoolExecutor(max_workers=min(_SCAN_WORKERS, len(directories))) as pool:
+			listings = iter(list(pool.map(_scan_directory, directories)))
+	else:
+		listings = map(_scan_directory, directories)
+
+	images: List[Path] = []
+	for is_directory, path in resolved:
+		if is_directory:
+			images.extend(next(listings))
+		else:
+			images.append(path)
 	return images
 
 
@@ -144,9 +188,16 @@ def _summarise_detections(image_path: Path, schemas: Sequence[Yolov8PersonCaptio
 def _write_sensor_readings_json(destination: Path, readings) -> None:
 	destination = destination.expanduser()
 	destination.parent.mkdir(parents=True, exist_ok=True)
-	payload = [reading.model_dump() for reading in readings]
+	encoder = json.JSONEncoder(indent=2, default=str)
+	# Encode one reading at a time instead of materialising the whole payload;
+	# the layout matches json.dump(list, indent=2) exactly.
 	with destination.open("w", encoding="utf-8") as fp:
-		json.dump(payload, fp, indent=2, default=str)
+		separator = "[\n  "
+		for reading in readings:
+			fp.write(separator)
+			fp.write(encoder.encode(reading.model_dump()).replace("\n", "\n  "))
+			separator = ",\n  "
+		fp.write("[]" if separator == "[\n  " else "\n]")
 	print(f"Sensor readings written to {destination}")
 
 
@@ -167,29 +218,51 @@ def main(argv: Sequence[str] | None = None) -> int:
 	exit_code = 0
 	all_readings = []
 
-	for image_path in image_paths:
+	options = dict(
+		mgrs=args.mgrs,
+		sensor_id=args.sensor_id,
+		observer_signature=args.observer,
+		weights=args.weights,
+		caption_model=args.caption_model,
+		confidence=args.confidence,
+		caption=args.caption,
+		device=args.device,
+		caption_corpus=args.caption_corpus,
+		caption_top_k=args.caption_top_k,
+	)
+
+	try:
+		Yolov8PersonCaptionSchema.warm_up(
+			weights=args.weights,
+			caption_model=args.caption_model,
+			caption=args.caption,
+			device=args.device,
+			caption_corpus=args.caption_corpus,
+		)
+	except Exception as exc:  # pragma: no cover - per-image analysis reports the failure
+		print(f"[warning] Model warm-up failed: {exc}", file=sys.stderr)
+
+	paths = iter(image_paths)
+	while batch := list(islice(paths, args.batch_size)):
 		try:
-			readings, schemas, _ = Yolov8PersonCaptionSchema.analyze_image(
-				image_path=image_path,
-				mgrs=args.mgrs,
-				sensor_id=args.sensor_id,
-				observer_signature=args.observer,
-				weights=args.weights,
-				caption_model=args.caption_model,
-				confidence=args.confidence,
-				caption=args.caption,
-				device=args.device,
-				caption_corpus=args.caption_corpus,
-				caption_top_k=args.caption_top_k,
-			)
-		except Exception as exc:  # pragma: no cover - surfaces runtime issues for CLI users
-			print(f"[error] Failed to analyse {image_path}: {exc}", file=sys.stderr)
-			exit_code = 1
-			continue
+			outputs = Yolov8PersonCaptionSchema.analyze_images(batch, batch_size=len(batch), **options)
+		except Exception:  # pragma: no cover - retry one by one to pinpoint the failing image
+			outputs = []
+			for image_path in batch:
+				try:
+					outputs.append(Yolov8PersonCaptionSchema.analyze_image(image_path=image_path, **options))
+				except Exception as exc:  # pragma: no cover - surfaces runtime issues for CLI users
+					print(f"[error] Failed to analyse {image_path}: {exc}", file=sys.stderr)
+					exit_code = 1
+					outputs.append(None)
 
-		all_readings.extend(readings)
-		if args.summary:
-			_summarise_detections(image_path, schemas)
+		for image_path, output in zip(batch, outputs):
+			if output is None:
+				continue
+			readings, schemas, _ = output
+			all_readings.extend(readings)
+			if args.summary:
+				_summarise_detections(image_path, schemas)
 
 	if args.readings_json and all_readings:
 		_write_sensor_readings_json(args.readings_json, all_readings)
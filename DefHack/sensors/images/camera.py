@@ -3,27 +3,48 @@ import time
 import os
 import threading
 import argparse
+import heapq
 import re
-from queue import Queue, Empty
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 
 # Default configuration
 DEFAULT_SAVE_FOLDER = os.path.join(os.path.dirname(__file__), "current_image")
 CAPTURE_INTERVAL = 10.0  # seconds
+JPEG_QUALITY = 95  # OpenCV's imwrite default
+_O_NOATIME = getattr(os, "O_NOATIME", 0)
+_TEMP_NAME = "image_temp.jpg"
+# Saved captures (image_<timestamp>.jpg, and legacy image_<n>_<timestamp>.jpg); the
+# in-flight temp file is never a capture, so pruning must not touch it.
+_IMAGE_PATTERN = re.compile(r'^image_(?!temp\.jpg$).+\.jpg$')
 
 
 class CameraWorker:
     """Background camera capture worker that continuously reads frames.
 
-    The latest frame is kept in a thread-safe queue of size 1 (always the newest).
+    Live captures are only grabbed in the background; the newest grabbed frame is
+    decoded when a consumer asks for it. Test images are kept in a lock-protected
+    single slot (always the newest).
     """
 
-    def __init__(self, src=0, test_images=None):
+    def __init__(self, src=0, test_images=None, width=None, height=None, fourcc="MJPG"):
         self.src = src
         self.test_images = test_images or []
+        self.width = width
+        self.height = height
+        self.fourcc = fourcc
         self._stop_event = threading.Event()
         self._thread = None
-        self._frame_q = Queue(maxsize=1)
         self._cap = None
+        # Guards the capture (grab() and retrieve() must not interleave) and the
+        # test-mode slot; _new_frame is set while an unconsumed frame is available.
+        self._lock = threading.Lock()
+        self._latest = None
+        self._new_frame = threading.Event()
+        # threading.Lock is not fair, so the grab loop holds off while a consumer is
+        # waiting for _lock instead of immediately re-taking it.
+        self._retrieve_cond = threading.Condition()
+        self._pending_retrievals = 0
 
     def start(self):
         if self._thread and self._thread.is_alive():
@@ -49,8 +70,28 @@ class CameraWorker:
         cap = cv2.VideoCapture(self.src)
         if not cap.isOpened():
             raise RuntimeError("Could not open webcam")
+        self._configure_capture(cap)
         return cap
 
+    def _configure_capture(self, cap):
+        """Best-effort capture tuning; backends silently ignore what they do not support.
+
+        A one-frame driver buffer keeps grabbed frames current instead of several
+        frames stale, and MJPEG is far cheaper to decode than raw or H.264 streams.
+        """
+        settings = [(cv2.CAP_PROP_BUFFERSIZE, 1)]
+        if self.fourcc:
+            settings.append((cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.fourcc)))
+        if self.width:
+            settings.append((cv2.CAP_PROP_FRAME_WIDTH, self.width))
+        if self.height:
+            settings.append((cv2.CAP_PROP_FRAME_HEIGHT, self.height))
+        for prop, value in settings:
+            try:
+                cap.set(prop, value)
+            except cv2.error:
+                pass
+
     def _run(self):
         # If test images provided, iterate them; otherwise read from webcam
         if self.test_images:
@@ -60,12 +101,10 @@ class CameraWorker:
                 frame = cv2.imread(p)
                 if frame is None:
                     continue
-                # keep only the latest frame in queue
-                try:
-                    self._frame_q.get_nowait()
-                except Empty:
-                    pass
-                self._frame_q.put(frame)
+                # keep only the latest frame
+                with self._lock:
+                    self._latest = frame
+                self._new_frame.set()
                 # small sleep to simulate continuous capture
                 time.sleep(0.1)
             return
@@ -76,23 +115,47 @@ class CameraWorker:
             print(f"Error opening capture: {e}")
             return
 
+        # Only grab (advance the stream without decoding); the frame is decoded in
+        # get_latest_frame, so frames nobody asks for never pay for decoding.
         while not self._stop_event.is_set():
-            ret, frame = self._cap.read()
+            with self._retrieve_cond:
+                self._retrieve_cond.wait_for(lambda: self._pending_retrievals == 0)
+            with self._lock:
+                ret = self._cap.grab()
             if not ret:
                 # avoid busy loop on failure
                 time.sleep(0.1)
                 continue
-            try:
-                self._frame_q.get_nowait()
-            except Empty:
-                pass
-            self._frame_q.put(frame)
+            self._new_frame.set()
 
     def get_latest_frame(self, timeout=0.0):
-        try:
-            return self._frame_q.get(timeout=timeout)
-        except Empty:
+        """Return the newest unconsumed frame, or None if none arrives within `timeout`.
+
+        The timeout covers both waiting for a frame and waiting for an in-progress
+        grab to finish.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._new_frame.wait(timeout):
             return None
+        with self._retrieve_cond:
+            self._pending_retrievals += 1
+        try:
+            remaining = -1 if deadline is None else max(0.0, deadline - time.monotonic())
+            if not self._lock.acquire(timeout=remaining):
+                return None
+            try:
+                self._new_frame.clear()
+                if self.test_images:
+                    frame, self._latest = self._latest, None
+                    return frame
+                ret, frame = self._cap.retrieve()
+            finally:
+                self._lock.release()
+        finally:
+            with self._retrieve_cond:
+                self._pending_retrievals -= 1
+                self._retrieve_cond.notify_all()
+        return frame if ret else None
 
 
 def ensure_folder(path):
@@ -100,41 +163,84 @@ def ensure_folder(path):
         os.makedirs(path, exist_ok=True)
 
 
+def write_jpeg(path: str, frame, quality: int = JPEG_QUALITY):
+    """Encode `frame` in memory and write the JPEG bytes to `path` with one write."""
+    ok, buf = cv2.imencode(".jpg", frame, [int(cv2.IMWRITE_JPEG_QUALITY), int(quality)])
+    if not ok:
+        raise RuntimeError("JPEG encoding failed")
+    # Write straight from the encoder's buffer; no intermediate bytes copy.
+    data = memoryview(buf.reshape(-1))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    try:
+        # Skip atime updates where supported (Linux; only allowed on files we own).
+        fd = os.open(path, flags | _O_NOATIME, 0o644)
+    except PermissionError:
+        fd = os.open(path, flags, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+# Encoded-but-unwritten frames allowed in flight before new captures are dropped.
+MAX_PENDING_WRITES = 2
+
+
+def _encode_and_finalize(frame, save_folder: str, keep: int):
+    # write to a temp file first to avoid partial files during rotation
+    temp_name = os.path.join(save_folder, _TEMP_NAME)
+    try:
+        write_jpeg(temp_name, frame)
+        # finalize as image_<timestamp>.jpg and drop the oldest captures
+        try:
+            rotate_and_save(save_folder, temp_name, keep=keep)
+        except Exception as e:
+            print(f"Warning: rotate_and_save failed: {e}")
+    except Exception as e:
+        print(f"Failed to write image to {temp_name}: {e}")
+
+
 def saver_loop(camera: CameraWorker, save_folder: str, interval: float, stop_event: threading.Event, count: int = None):
     """Save latest frame every `interval` seconds without blocking the camera thread.
 
     This function runs in the main thread (or a dedicated thread) and uses a timer to decide
     when to save, but it never sleeps for the whole interval — it waits with a timeout so it
-    can react to stop_event quickly.
+    can react to stop_event quickly. JPEG encoding and disk writes run on a single writer
+    thread; if it falls `MAX_PENDING_WRITES` frames behind, new captures are dropped rather
+    than queued.
     """
     ensure_folder(save_folder)
     next_save = time.time()
     saved = 0
-    while not stop_event.is_set():
-        now = time.time()
-        # if it's time to save (or overdue), attempt to get the latest frame
-        if now >= next_save:
-            frame = camera.get_latest_frame(timeout=0.5)
-            if frame is not None:
-                # write to a temp file first to avoid partial files during rotation
-                temp_name = os.path.join(save_folder, "image_temp.jpg")
-                try:
-                    cv2.imwrite(temp_name, frame)
-                    # rotate and rename files so latest is image_1_<timestamp>.jpg
-                    try:
-                        rotate_and_save(save_folder, temp_name, keep=5)
-                    except Exception as e:
-                        print(f"Warning: rotate_and_save failed: {e}")
-                except Exception as e:
-                    print(f"Failed to write image to {temp_name}: {e}")
-                saved += 1
-                if count is not None and saved >= count:
-                    break
-            else:
-                print("No frame available to save at", time.strftime("%Y-%m-%d %H:%M:%S"))
-            next_save += interval
-        # wait a short time so we don't busy-wait, but remain responsive
-        time.sleep(0.1)
+    # One writer keeps temp-file use and rotation strictly sequential.
+    writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="CaptureWriter")
+    pending = threading.BoundedSemaphore(MAX_PENDING_WRITES)
+    try:
+        while not stop_event.is_set():
+            now = time.time()
+            # if it's time to save (or overdue), attempt to get the latest frame
+            if now >= next_save:
+                frame = camera.get_latest_frame(timeout=0.5)
+                if frame is not None:
+                    # get_latest_frame hands over a frame nobody else touches, so no copy
+                    if pending.acquire(blocking=False):
+                        future = writer.submit(_encode_and_finalize, frame, save_folder, 5)
+                        future.add_done_callback(lambda _f: pending.release())
+                        saved += 1
+                        if count is not None and saved >= count:
+                            break
+                    else:
+                        print("Writer busy; dropping frame at", time.strftime("%Y-%m-%d %H:%M:%S"))
+                else:
+                    print("No frame available to save at", time.strftime("%Y-%m-%d %H:%M:%S"))
+                next_save += interval
+            # sleep until the next capture is due (capped so the loop stays lively) and
+            # wake immediately if asked to stop
+            if stop_event.wait(max(0.0, min(0.5, next_save - time.time()))):
+                break
+    finally:
+        writer.shutdown(wait=True)
 
 
 def parse_args():
@@ -142,189 +248,66 @@ def parse_args():
     p.add_argument("--save-folder", "-o", default=DEFAULT_SAVE_FOLDER, help="Folder to save images")
     p.add_argument("--interval", "-i", type=float, default=CAPTURE_INTERVAL, help="Seconds between saved images")
     p.add_argument("--src", type=int, default=0, help="Camera device index")
+    p.add_argument("--width", type=int, default=None, help="Requested capture width in pixels")
+    p.add_argument("--height", type=int, default=None, help="Requested capture height in pixels")
     p.add_argument("--test", action="store_true", help="Run in test mode using sample images")
     p.add_argument("--count", type=int, default=None, help="Stop after saving this many images (useful for tests)")
     return p.parse_args()
 
 
-def prune_folder(folder_path: str, keep: int = 1):
+def prune_folder(folder_path: str, keep: int = 1, pattern=None):
     """Remove oldest files in folder_path until only `keep` newest files remain.
 
-    Files are ordered by modification time. Non-file entries are ignored.
+    Files are ordered by modification time. Non-file entries are ignored, as are
+    files whose name does not match `pattern` when one is given.
     """
     if keep < 0:
         return
-    # list files only
+    # list files only; DirEntry caches the type and stat results
     entries = []
-    for name in os.listdir(folder_path):
-        full = os.path.join(folder_path, name)
-        if os.path.isfile(full):
-            try:
-                mtime = os.path.getmtime(full)
-            except OSError:
+    with os.scandir(folder_path) as it:
+        for entry in it:
+            if pattern is not None and not pattern.match(entry.name):
                 continue
-            entries.append((mtime, full))
-    # sort by mtime ascending (oldest first)
-    entries.sort(key=lambda x: x[0])
-    # remove oldest until len(entries) <= keep
+            if entry.is_file():
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                entries.append((mtime, entry.path))
     to_remove = len(entries) - keep
-    for i in range(to_remove):
+    if to_remove <= 0:
+        return
+    # only the oldest `to_remove` need ordering, not the whole listing
+    for _, full in heapq.nsmallest(to_remove, entries, key=itemgetter(0)):
         try:
-            os.remove(entries[i][1])
-            print(f"Pruned old image: {entries[i][1]}")
+            os.remove(full)
+            print(f"Pruned old image: {full}")
         except Exception:
             # ignore errors removing individual files
             pass
 
 
 def rotate_and_save(folder_path: str, temp_filename: str, keep: int = 5):
+    """Move the temp capture to a unique ``image_<timestamp>.jpg`` and keep the newest `keep`.
 
-
-
-
-
-
-    """Deterministic rotate-and-save that avoids duplicate indexes.
-
-    Strategy:
-    - Collect files matching image_<index>_<suffix> and group by index.
-    - For each index keep only the newest file (by mtime), remove others.
-    - Remove any indexes > keep.
-    - Shift files from high->low (idx -> idx+1), removing destination before rename.
-    - Move temp file to image_1_<timestamp>.jpg.
-    - Final pass: remove any image_ files with index outside 1..keep and ensure
-      there is at most one file per index.
+    Captures are never renamed once written: recency comes from the timestamped
+    name and mtime, so each save costs one rename plus a single directory scan
+    instead of shifting every older capture down an index.
     """
-    pattern = re.compile(r'^image_(\d+)_(.+)$')
-    grouped = {}  # idx -> list of (mtime, name)
-
-    # collect and group matching files
-    for name in os.listdir(folder_path):
-        full = os.path.join(folder_path, name)
-        if not os.path.isfile(full):
-            continue
-        m = pattern.match(name)
-        if not m:
-            # ignore non-conforming names (they may be removed later)
-            continue
-        try:
-            idx = int(m.group(1))
-        except Exception:
-            continue
-        try:
-            mtime = os.path.getmtime(full)
-        except Exception:
-            mtime = 0
-        grouped.setdefault(idx, []).append((mtime, name))
-
-    # deduplicate: keep newest per index, remove others
-    existing = {}
-    for idx, items in grouped.items():
-        items.sort(key=lambda x: x[0], reverse=True)  # newest first
-        keep_name = items[0][1]
-        existing[idx] = keep_name
-        for _, old_name in items[1:]:
-            try:
-                os.remove(os.path.join(folder_path, old_name))
-                print(f"Removed duplicate index file: {old_name}")
-            except Exception:
-                pass
-
-    # remove any indexes beyond keep
-    for idx in sorted([i for i in existing.keys() if i > keep]):
-        try:
-            os.remove(os.path.join(folder_path, existing[idx]))
-            print(f"Removed overflow image: {existing[idx]}")
-            del existing[idx]
-        except Exception:
-            pass
-
-    # shift files from highest to lowest to avoid clobbering
-    for idx in range(keep - 1, 0, -1):
-        src_name = existing.get(idx)
-        if not src_name:
-            continue
-        src_path = os.path.join(folder_path, src_name)
-        # build destination name preserving suffix
-        parts = src_name.split('_', 2)
-        suffix = parts[2] if len(parts) > 2 else ''
-        dst_name = f"image_{idx+1}_{suffix}"
-        dst_path = os.path.join(folder_path, dst_name)
-        try:
-            # remove any existing destination first to avoid duplicates
-            if os.path.exists(dst_path):
-                os.remove(dst_path)
-            os.rename(src_path, dst_path)
-            # update mapping
-            existing[idx+1] = dst_name
-            del existing[idx]
-        except Exception:
-            # if rename failed, try to continue
-            pass
-
-    # move temp file to image_1_<ts>.jpg
     if not os.path.exists(temp_filename):
         return
-    ts = time.strftime("%Y%m%d-%H%M%S")
-    final_name = f"image_1_{ts}.jpg"
-    final_path = os.path.join(folder_path, final_name)
+    now = time.time()
+    ts = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}-{int(now * 1000) % 1000:03d}"
+    final_path = os.path.join(folder_path, f"image_{ts}.jpg")
     try:
-        if os.path.exists(final_path):
-            os.remove(final_path)
-        os.rename(temp_filename, final_path)
+        os.replace(temp_filename, final_path)
         print(f"Saved {final_path}")
     except Exception as e:
         print(f"Warning: failed to finalize saved image: {e}")
+        return
 
-    # final cleanup: ensure at most one file per index and indices are 1..keep
-    seen = {}
-    for name in os.listdir(folder_path):
-        full = os.path.join(folder_path, name)
-        if not os.path.isfile(full):
-            continue
-        m = pattern.match(name)
-        if not m:
-            # non-matching image_ names (or others) -> ignore
-            continue
-        try:
-            idx = int(m.group(1))
-        except Exception:
-            continue
-        if idx < 1 or idx > keep:
-            try:
-                if os.path.abspath(full) == os.path.abspath(final_path):
-                    continue
-                os.remove(full)
-                print(f"Removed out-of-range image: {name}")
-            except Exception:
-                pass
-            continue
-        # deduplicate any remaining duplicates by keeping newest
-        if idx in seen:
-            # decide which one to keep by mtime
-            try:
-                cur_mtime = os.path.getmtime(full)
-                kept_mtime = os.path.getmtime(os.path.join(folder_path, seen[idx]))
-                if cur_mtime > kept_mtime:
-                    # replace kept with current, remove old
-                    try:
-                        os.remove(os.path.join(folder_path, seen[idx]))
-                    except Exception:
-                        pass
-                    seen[idx] = name
-                else:
-                    try:
-                        os.remove(full)
-                    except Exception:
-                        pass
-            except Exception:
-                # best-effort: remove duplicate
-                try:
-                    os.remove(full)
-                except Exception:
-                    pass
-        else:
-            seen[idx] = name
+    prune_folder(folder_path, keep=keep, pattern=_IMAGE_PATTERN)
 
 
 def main():
@@ -343,7 +326,7 @@ def main():
                     test_images.append(os.path.join(base, n))
         test_images.sort()
 
-    camera = CameraWorker(src=args.src, test_images=test_images)
+    camera = CameraWorker(src=args.src, test_images=test_images, width=args.width, height=args.height)
     stop_event = threading.Event()
 
     try:
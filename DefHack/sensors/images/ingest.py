@@ -10,11 +10,14 @@ on the next iteration.
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
+import os
 import sys
 import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Iterable, List, Optional, Sequence
 
@@ -22,7 +25,13 @@ from urllib import error, request
 
 import cv2
 
-from .camera import CameraWorker, ensure_folder
+try:  # pragma: no cover - optional dependency (the "http" extra)
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:  # pragma: no cover - fall back to urllib without keep-alive
+    requests = None
+
+from .camera import CameraWorker, ensure_folder, write_jpeg
 from .yolov8_person_pipeline import Yolov8PersonCaptionSchema
 from ..SensorSchema import SensorObservationIn
 
@@ -36,6 +45,8 @@ DEFAULT_SAVE_FOLDER = _IMAGES_DIR / "current_image"
 DEFAULT_BACKLOG_PATH = _PACKAGE_ROOT / "sensor_backlog.json"
 DEFAULT_UNIT_LABEL = "Alpha Company"
 
+_SESSION = None
+
 
 @dataclass
 class AppConfig:
@@ -300,7 +311,53 @@ def _canonicalise_payload(raw: dict[str, Any], *, unit_override: Optional[str] =
     return structured
 
 
-def _post_payload(payload: dict[str, object], *, url: str, api_key: Optional[str], timeout: float) -> bool:
+class _EndpointUnreachable(Exception):
+    """Raised by the posters when the ingestion endpoint cannot be reached at all."""
+
+
+def _get_session():
+    """Return the process-wide HTTP session so deliveries reuse warm connections."""
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            # No transport retries: an unreachable host should cost one timeout, and
+            # undelivered readings are retried from the backlog on the next cycle anyway.
+            max_retries=0,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _SESSION = session
+    return _SESSION
+
+
+def _post_payload_session(payload: dict[str, object], *, url: str, api_key: Optional[str], timeout: float) -> bool:
+    headers = {"X-API-Key": api_key} if api_key else None
+    try:
+        resp = _get_session().post(url, json=payload, timeout=timeout, headers=headers)
+    except (requests.ConnectionError, requests.Timeout) as exc:
+        print(f"Network error posting sensor reading: {exc}")
+        raise _EndpointUnreachable from exc
+    except requests.RequestException as exc:
+        print(f"Network error posting sensor reading: {exc}")
+        return False
+    except Exception as exc:
+        print(f"Unexpected error posting sensor reading: {exc}")
+        return False
+
+    if 200 <= resp.status_code < 300:
+        return True
+    details = resp.text.strip()
+    if details:
+        print(f"HTTP error posting sensor reading: {resp.status_code} {resp.reason} -> {details}")
+    else:
+        print(f"HTTP error posting sensor reading: {resp.status_code} {resp.reason}")
+    return False
+
+
+def _post_payload_urllib(payload: dict[str, object], *, url: str, api_key: Optional[str], timeout: float) -> bool:
     encoded = json.dumps(payload).encode("utf-8")
     req = request.Request(url, data=encoded, method="POST")
     req.add_header("Content-Type", "application/json")
@@ -326,13 +383,20 @@ def _post_payload(payload: dict[str, object], *, url: str, api_key: Optional[str
             print(f"HTTP error posting sensor reading: {http_exc.status} {http_exc.reason} -> {details}")
         else:
             print(f"HTTP error posting sensor reading: {http_exc.status} {http_exc.reason}")
-    except error.URLError as url_exc:
+    except (error.URLError, TimeoutError) as url_exc:
         print(f"Network error posting sensor reading: {url_exc}")
+        raise _EndpointUnreachable from url_exc
     except Exception as exc:
         print(f"Unexpected error posting sensor reading: {exc}")
     return False
 
 
+def _post_payload(payload: dict[str, object], *, url: str, api_key: Optional[str], timeout: float) -> bool:
+    if requests is not None:
+        return _post_payload_session(payload, url=url, api_key=api_key, timeout=timeout)
+    return _post_payload_urllib(payload, url=url, api_key=api_key, timeout=timeout)
+
+
 def _prepare_payloads(
     readings: Iterable[SensorObservationIn],
     *,
@@ -367,10 +431,16 @@ def _deliver_readings(
     remaining: List[dict[str, object]] = []
     delivered = 0
 
-    for payload in backlog_entries:
+    for index, payload in enumerate(backlog_entries):
         if debug_payloads:
             print("DEBUG payload ->", json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=False))
-        if poster(payload, url=url, api_key=api_key, timeout=timeout):
+        try:
+            posted = poster(payload, url=url, api_key=api_key, timeout=timeout)
+        except _EndpointUnreachable:
+            # Every further attempt would wait out its own timeout; keep the rest for later.
+            remaining.extend(backlog_entries[index:])
+            break
+        if posted:
             delivered += 1
             print(f"Delivered reading: {payload.get('what')} @ {payload.get('time')}")
         else:
@@ -394,9 +464,7 @@ def _capture_frame(camera: CameraWorker, save_dir: Path) -> Optional[Path]:
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
     image_path = save_dir / f"capture_{timestamp}.jpg"
     try:
-        if not cv2.imwrite(str(image_path), frame):
-            print(f"Failed to write image to {image_path}.")
-            return None
+        write_jpeg(str(image_path), frame)
     except Exception as exc:
         print(f"Error while saving image {image_path}: {exc}")
         return None
@@ -410,20 +478,20 @@ def _prune_captures(folder: Path, *, keep: int) -> None:
         return
     try:
         entries = []
-        for item in folder.iterdir():
-            if not item.is_file():
-                continue
-            if not item.name.startswith("capture_"):
-                continue
-            try:
-                mtime = item.stat().st_mtime
-            except OSError:
-                continue
-            entries.append((mtime, item))
+        # scandir's DirEntry caches the file type and stat, so each capture costs one stat.
+        with os.scandir(folder) as it:
+            for entry in it:
+                if not entry.name.startswith("capture_") or not entry.is_file():
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                entries.append((mtime, Path(entry.path)))
         if len(entries) <= keep:
             return
-        entries.sort(key=lambda pair: pair[0])
-        for _, path in entries[:-keep]:
+        stale = heapq.nsmallest(len(entries) - keep, entries, key=itemgetter(0))
+        for _, path in stale:
             try:
                 path.unlink()
                 print(f"Removed stale capture: {path.name}")
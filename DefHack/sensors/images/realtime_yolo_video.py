@@ -8,13 +8,16 @@ that only raw YOLO detections are produced, keeping latency low.
 from __future__ import annotations
 
 import argparse
+import queue
 import sys
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional, Sequence
+from typing import Callable, Iterable, Optional, Sequence
 
 import cv2
+import numpy as np
 import torch
 from ultralytics import YOLO
 
@@ -46,6 +49,10 @@ def _default_weights() -> str:
     return candidate
 
 
+# Where Ultralytics places each export format relative to the source weights.
+_EXPORT_SUFFIXES = {"onnx": ".onnx", "openvino": "_openvino_model"}
+
+
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         prog="python -m DefHack.sensors.images.realtime_yolo_video",
@@ -58,6 +65,13 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     default=_default_weights(),
     help="Ultralytics weights identifier or path (default: local yolov8n if present)",
     )
+    parser.add_argument(
+        "--backend",
+        choices=sorted(_EXPORT_SUFFIXES) + ["torch"],
+        default="torch",
+        help="Inference runtime; onnx/openvino export the weights once next to the .pt "
+        "file and usually outpace PyTorch on CPU (default: torch)",
+    )
     parser.add_argument(
         "--confidence",
         type=float,
@@ -82,6 +96,25 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Optional image size (pixels) passed to YOLO for inference",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Frames per inference call; >1 trades display latency for throughput (default: 1)",
+    )
+    parser.add_argument(
+        "--buffer-size",
+        type=int,
+        default=1,
+        help="Capture backend frame buffer size; 1 keeps live sources current (default: 1)",
+    )
+    parser.add_argument(
+        "--no-half",
+        dest="half",
+        action="store_false",
+        help="Keep FP32 inference on CUDA instead of half precision",
+    )
+    parser.set_defaults(half=True)
     parser.add_argument(
         "--output",
         type=Path,
@@ -101,6 +134,12 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         help=argparse.SUPPRESS,
     )
     parser.set_defaults(display=True)
+    parser.add_argument(
+        "--display-every",
+        type=int,
+        default=1,
+        help="Refresh the display window every N frames (default: 1)",
+    )
     parser.add_argument(
         "--no-throttle",
         dest="throttle",
@@ -129,13 +168,51 @@ def _resolve_device(preferred: Optional[str]) -> str:
     return "cuda" if torch.cuda.is_available() else "cpu"
 
 
-def _open_video(path: Path) -> cv2.VideoCapture:
+def _load_model(weights: str, backend: str, device: str, imgsz: Optional[int]):
+    """Load ``weights`` for ``backend``, exporting (and caching) the torch checkpoint if needed."""
+
+    if backend == "torch":
+        model = YOLO(weights)
+        model.to(device)
+        return model
+
+    source = Path(weights)
+    suffix = _EXPORT_SUFFIXES[backend]
+    if source.name.endswith(suffix):
+        # Already exported by the caller; it runs at whatever size it was exported with.
+        exported = source
+    else:
+        # Exports are static batch-1 graphs at one input size, so the size is part of the
+        # cached name and changing --imgsz exports (and then reuses) a separate model.
+        size = imgsz or 640
+        exported = source.with_name(f"{source.stem}_{size}{suffix}")
+        if not exported.exists():
+            print(f"Exporting {weights} to {backend} at {size}px (one-off)...")
+            produced = Path(YOLO(weights).export(format=backend, imgsz=size, dynamic=False))
+            produced.replace(exported)
+    # Exported runtimes are placed through the predict ``device`` argument, not .to().
+    return YOLO(str(exported), task="detect")
+
+
+def _open_video(path: Path, buffer_size: int = 1) -> cv2.VideoCapture:
     capture = cv2.VideoCapture(str(path))
     if not capture.isOpened():
         raise FileNotFoundError(f"Unable to open video: {path}")
+    # A short driver queue keeps live (RTSP/webcam-backed) sources from lagging several
+    # frames behind; file backends ignore the property.
+    try:
+        capture.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size)
+    except cv2.error:
+        pass
     return capture
 
 
+def _poll_key() -> int:
+    # pollKey (OpenCV >= 4.5) services the GUI without waitKey's minimum 1 ms sleep.
+    poll = getattr(cv2, "pollKey", None)
+    return poll() if poll is not None else cv2.waitKey(1)
+
+
 def _initialise_writer(cap: cv2.VideoCapture, output_path: Path) -> cv2.VideoWriter:
     fourcc = cv2.VideoWriter_fourcc(*"mp4v")
     fps = cap.get(cv2.CAP_PROP_FPS)
@@ -146,14 +223,28 @@ def _initialise_writer(cap: cv2.VideoCapture, output_path: Path) -> cv2.VideoWri
     return cv2.VideoWriter(str(output_path), fourcc, fps, (width, height))
 
 
-def _resolve_label(names: Iterable[str] | dict[int, str], class_idx: int) -> str:
+def _label_getter(names: Iterable[str] | dict[int, str]) -> Callable[[int], str]:
+    """Resolve the class-name lookup once per result rather than once per box."""
+
     if isinstance(names, dict):
-        return names.get(class_idx, str(class_idx))
+        return lambda class_idx: names.get(class_idx, str(class_idx))
     if isinstance(names, list):
-        if 0 <= class_idx < len(names):
-            return names[class_idx]
-        return str(class_idx)
-    return str(class_idx)
+        count = len(names)
+        return lambda class_idx: names[class_idx] if 0 <= class_idx < count else str(class_idx)
+    return str
+
+
+def _put_label(frame, text: str, org: tuple[int, int], scale: float) -> None:
+    """Draw white text on a filled black box.
+
+    One fill plus one non-antialiased glyph pass replaces the antialiased shadow/text
+    ``putText`` pair, which dominated drawing cost on crowded frames.
+    """
+
+    (width, height), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, 1)
+    x, y = org
+    cv2.rectangle(frame, (x, y - height - 2), (x + width + 2, y + baseline), (0, 0, 0), cv2.FILLED)
+    cv2.putText(frame, text, (x + 1, y), cv2.FONT_HERSHEY_SIMPLEX, scale, (255, 255, 255), 1, cv2.LINE_8)
 
 
 def _draw_detections(frame, result, *, confidence: float) -> int:
@@ -161,26 +252,101 @@ def _draw_detections(frame, result, *, confidence: float) -> int:
     if boxes is None or len(boxes) == 0:
         return 0
 
-    detections = 0
-    names = result.names
-    for cls_val, conf_val, box_tensor in zip(boxes.cls.tolist(), boxes.conf.tolist(), boxes.xyxy):
-        if conf_val < confidence:
-            continue
-        x1, y1, x2, y2 = [int(v) for v in box_tensor.tolist()]
+    # One device-to-host copy per tensor; the threshold is applied as a mask so the
+    # remaining Python loop only issues OpenCV draw calls.
+    cls = boxes.cls.cpu().numpy().astype(np.int64)
+    conf = boxes.conf.cpu().numpy()
+    xyxy = boxes.xyxy.cpu().numpy().astype(np.int32)
+    keep = np.flatnonzero(conf >= confidence)
+    label_for = _label_getter(result.names)
+
+    for idx in keep.tolist():
+        x1, y1, x2, y2 = xyxy[idx].tolist()
         cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
-        label = _resolve_label(names, int(cls_val))
-        caption = f"{label} {conf_val:.2f}"
-        text_org = (x1, max(15, y1 - 10))
-        cv2.putText(frame, caption, text_org, cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 3, cv2.LINE_AA)
-        cv2.putText(frame, caption, text_org, cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1, cv2.LINE_AA)
-        detections += 1
-    return detections
+        caption = f"{label_for(int(cls[idx]))} {conf[idx]:.2f}"
+        _put_label(frame, caption, (x1, max(15, y1 - 10)), 0.5)
+    return int(keep.size)
 
 
 def _overlay_metrics(frame, fps: float, detections: int) -> None:
     overlay = f"FPS: {fps:.1f} | detections: {detections}"
-    cv2.putText(frame, overlay, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 0), 3, cv2.LINE_AA)
-    cv2.putText(frame, overlay, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 1, cv2.LINE_AA)
+    _put_label(frame, overlay, (10, 30), 0.7)
+
+
+def _warm_predictor(model, cap: cv2.VideoCapture, predict_kwargs: dict) -> Callable:
+    """Run one throwaway inference and return a callable that reuses the built predictor.
+
+    ``model.predict`` re-merges and re-validates its overrides on every call; once the
+    warm-up has configured ``model.predictor`` with ``predict_kwargs``, calling the
+    predictor directly skips that pass. Falls back to ``model.predict`` if the installed
+    Ultralytics does not expose a predictor.
+    """
+
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or 640
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or 640
+    # Also pays CUDA context creation and kernel selection before timing starts.
+    with torch.inference_mode():
+        model.predict(np.zeros((height, width, 3), dtype=np.uint8), **predict_kwargs)
+
+    predictor = getattr(model, "predictor", None)
+
+    # Ultralytics only guards its forward pass; cover pre/post-processing as well.
+    @torch.inference_mode()
+    def infer(source):
+        if callable(predictor):
+            return predictor(source=source, stream=False)
+        return model.predict(source, **predict_kwargs)
+
+    return infer
+
+
+_END_OF_STREAM = object()
+
+
+def _decode_frames(
+    cap: cv2.VideoCapture,
+    free_frames: "queue.Queue",
+    decoded: "queue.Queue",
+    stop_event: threading.Event,
+    limit: Optional[int],
+) -> None:
+    """Decode stage: fill recycled buffers from ``free_frames`` and hand them to inference."""
+
+    count = 0
+    try:
+        while not stop_event.is_set() and (limit is None or count < limit):
+            try:
+                buffer = free_frames.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            ret, frame = cap.read(buffer)
+            if not ret:
+                break
+            decoded.put(frame)
+            count += 1
+    finally:
+        decoded.put(_END_OF_STREAM)
+
+
+def _encode_frames(
+    writer: cv2.VideoWriter,
+    pending: "queue.Queue",
+    free_frames: "queue.Queue",
+    stop_event: threading.Event,
+) -> None:
+    """Encode stage: write annotated frames in order, then return their buffers to the pool."""
+
+    try:
+        while True:
+            frame = pending.get()
+            if frame is _END_OF_STREAM:
+                return
+            writer.write(frame)
+            free_frames.put(frame)
+    except cv2.error as exc:
+        print(f"[warning] Video writer failed ({exc}); stopping.")
+        # Buffers are no longer recycled, so wind the decoder down instead of starving it.
+        stop_event.set()
 
 
 def _process_video(args: argparse.Namespace) -> VideoSummary:
@@ -189,10 +355,12 @@ def _process_video(args: argparse.Namespace) -> VideoSummary:
         raise FileNotFoundError(f"Video file not found: {video_path}")
 
     device = _resolve_device(args.device)
-    model = YOLO(str(args.weights))
-    model.to(device)
+    if device.startswith("cuda"):
+        # Frame size is fixed for the whole video, so autotuned conv kernels are reused.
+        torch.backends.cudnn.benchmark = True
+    model = _load_model(str(args.weights), args.backend, device, args.imgsz)
 
-    cap = _open_video(video_path)
+    cap = _open_video(video_path, max(1, args.buffer_size))
     writer = _initialise_writer(cap, args.output) if args.output else None
 
     source_fps = cap.get(cv2.CAP_PROP_FPS)
@@ -200,76 +368,143 @@ def _process_video(args: argparse.Namespace) -> VideoSummary:
     frame_interval = (1.0 / source_fps) if (args.throttle and source_fps > 0) else 0.0
 
     summary = VideoSummary()
-    rolling_start = time.perf_counter()
+    batch_size = max(1, args.batch_size)
+    if batch_size > 1 and args.backend != "torch":
+        print(f"[info] {args.backend} graphs are exported with a static batch of 1; ignoring --batch-size.")
+        batch_size = 1
+    if batch_size > 1 and args.display and frame_interval > 0:
+        # A paced on-screen preview would stall for a whole batch between refreshes.
+        print("[info] Display with throttling is on; falling back to single-frame inference.")
+        batch_size = 1
+    # Decode, inference and encode run concurrently. Frames travel through a fixed pool
+    # of buffers: the current batch plus up to two batches decoded ahead or awaiting the
+    # writer. The pool bounds memory, so the hand-off queues themselves never block.
+    free_frames: queue.Queue = queue.Queue()
+    for _ in range(3 * batch_size):
+        free_frames.put(None)
+    decoded: queue.Queue = queue.Queue()
+    pending_writes: queue.Queue = queue.Queue()
+    stop_event = threading.Event()
+    display_every = max(1, args.display_every)
+    decoder = threading.Thread(
+        target=_decode_frames,
+        args=(cap, free_frames, decoded, stop_event, args.max_frames),
+        name="video-decode",
+        daemon=True,
+    )
+    encoder = None
+    if writer is not None:
+        encoder = threading.Thread(
+            target=_encode_frames,
+            args=(writer, pending_writes, free_frames, stop_event),
+            name="video-encode",
+            daemon=True,
+        )
+    predict_kwargs = {
+        "conf": args.confidence,
+        "verbose": False,
+        "device": device,
+        "max_det": args.max_det,
+        "stream": False,
+    }
+    if args.imgsz is not None:
+        predict_kwargs["imgsz"] = args.imgsz
+    use_half = args.half and args.backend == "torch" and device.startswith("cuda")
+    if use_half:
+        predict_kwargs["half"] = True
 
     print(f"Running YOLOv8 realtime labelling on: {video_path}")
-    print(f"Using weights: {args.weights} | device: {device}")
+    print(
+        f"Using weights: {args.weights} | backend: {args.backend} | device: {device}"
+        f"{' (fp16)' if use_half else ''}"
+    )
     if source_fps:
         print(f"Source FPS: {source_fps:.2f}")
+    if batch_size > 1:
+        print(f"Batching {batch_size} frames per inference call")
     if args.output:
         print(f"Saving annotated video to: {args.output}")
     print("Press 'q' in the display window to stop early.\n")
 
     try:
-        while True:
-            if args.max_frames is not None and summary.total_frames >= args.max_frames:
-                break
-
-            ret, frame = cap.read()
-            if not ret:
+        infer = _warm_predictor(model, cap, predict_kwargs)
+        rolling_start = time.perf_counter()
+        decoder.start()
+        if encoder is not None:
+            encoder.start()
+
+        stop = False
+        exhausted = False
+        while not stop and not exhausted:
+            batch = []
+            while len(batch) < batch_size:
+                frame = decoded.get()
+                if frame is _END_OF_STREAM:
+                    exhausted = True
+                    break
+                batch.append(frame)
+            if not batch:
                 break
 
             loop_start = time.perf_counter()
-            infer_start = loop_start
-            predict_kwargs = {
-                "conf": args.confidence,
-                "verbose": False,
-                "device": device,
-                "max_det": args.max_det,
-                "stream": False,
-            }
-            if args.imgsz is not None:
-                predict_kwargs["imgsz"] = args.imgsz
-
-            results = model.predict(frame, **predict_kwargs)
-            result = results[0] if results else None
-            annotated = frame
-
-            frame_detections = 0
-            if result is not None:
-                frame_detections = _draw_detections(annotated, result, confidence=args.confidence)
-
-            infer_elapsed = time.perf_counter() - infer_start
-            fps = 1.0 / infer_elapsed if infer_elapsed > 0 else 0.0
-            _overlay_metrics(annotated, fps, frame_detections)
-
-            if writer is not None:
-                writer.write(annotated)
-
-            if args.display:
-                try:
-                    cv2.imshow("YOLOv8 realtime", annotated)
-                except cv2.error as exc:
-                    print(f"[warning] Display unavailable ({exc}); disabling window output.")
-                    args.display = False
+            # One forward pass per batch amortises pre/post-processing and launch overhead.
+            results = infer(batch if len(batch) > 1 else batch[0])
+            results = list(results) if results else []
+            infer_elapsed = time.perf_counter() - loop_start
+            fps = len(batch) / infer_elapsed if infer_elapsed > 0 else 0.0
+
+            for position, annotated in enumerate(batch):
+                result = results[position] if position < len(results) else None
+
+                frame_detections = 0
+                if result is not None:
+                    frame_detections = _draw_detections(annotated, result, confidence=args.confidence)
+
+                _overlay_metrics(annotated, fps, frame_detections)
+
+                # HighGUI stays on this thread; the frame is shown before it is handed to
+                # the encoder, which recycles its buffer once written.
+                if args.display and summary.total_frames % display_every == 0:
+                    try:
+                        cv2.imshow("YOLOv8 realtime", annotated)
+                    except cv2.error as exc:
+                        print(f"[warning] Display unavailable ({exc}); disabling window output.")
+                        args.display = False
+                    else:
+                        if _poll_key() & 0xFF == ord("q"):
+                            print("Stopping due to user input.")
+                            stop = True
+                            break
+
+                if encoder is not None:
+                    pending_writes.put(annotated)
                 else:
-                    if cv2.waitKey(1) & 0xFF == ord("q"):
-                        print("Stopping due to user input.")
-                        break
+                    free_frames.put(annotated)
+
+                summary.total_frames += 1
+                summary.total_detections += frame_detections
 
-            summary.total_frames += 1
-            summary.total_detections += frame_detections
+                if frame_interval > 0:
+                    elapsed_since_start = time.perf_counter() - loop_start
+                    sleep_time = (position + 1) * frame_interval - elapsed_since_start
+                    if sleep_time > 0:
+                        time.sleep(sleep_time)
 
-            if frame_interval > 0:
-                elapsed_since_start = time.perf_counter() - loop_start
-                sleep_time = frame_interval - elapsed_since_start
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+        # Flush the encoder so the average FPS covers every written frame.
+        if encoder is not None:
+            pending_writes.put(_END_OF_STREAM)
+            encoder.join()
 
         elapsed_total = time.perf_counter() - rolling_start
         summary.avg_fps = summary.total_frames / elapsed_total if elapsed_total > 0 else 0.0
 
     finally:
+        stop_event.set()
+        if decoder.is_alive():
+            decoder.join()
+        if encoder is not None and encoder.is_alive():
+            pending_writes.put(_END_OF_STREAM)
+            encoder.join()
         cap.release()
         if writer is not None:
             writer.release()
@@ -10,6 +10,7 @@ import argparse
 import json
 import sys
 import textwrap
+from itertools import islice
 from pathlib import Path
 from typing import Iterable, List
 
@@ -31,6 +32,13 @@ except ImportError:  # pragma: no cover - handle relative execution contexts
 IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff"}
 
 
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return number
+
+
 def parse_args(argv: List[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         prog="run_inference_v8.py",
@@ -66,6 +74,12 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
         default=0.25,
         help="Confidence threshold for detections (0-1).",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=_positive_int,
+        default=16,
+        help="Number of images per YOLO forward pass (default: 16).",
+    )
     parser.add_argument(
         "--show",
         action="store_true",
@@ -207,46 +221,50 @@ def main(argv: List[str] | None = None) -> int:
     print(f"Running YOLOv8 inference with weights: {args.weights}")
     print(f"Processing {len(image_paths)} image(s) from {args.image_dir.resolve()}\n")
 
-    for image_path in image_paths:
-        readings, schemas, result = Yolov8PersonCaptionSchema.analyze_image(
-            image_path=image_path,
-            mgrs=args.mgrs,
-            sensor_id=args.sensor_id,
-            observer_signature=args.observer_signature,
-            weights=args.weights,
-            caption_model=args.caption_model,
-            confidence=args.confidence,
-            caption=args.caption,
-            device=device,
-            caption_corpus=args.caption_corpus,
-            caption_top_k=args.caption_top_k,
-        )
-        all_readings.extend(readings)
-
-        if result is None:
-            print(f"{image_path.name}: No results returned by the model.")
-            continue
-
-        summarize_result(result, image_path)
-        output_path = annotate_and_save(result, image_path, args.output_dir)
-        print(f"  ↳ Saved annotated image to {output_path}")
-
-        if args.caption:
-            if schemas:
-                for schema in schemas:
-                    if schema.caption:
-                        print(
-                            f"    caption[{schema.detection_index}] ({schema.label}): {schema.caption}"
-                        )
-                    else:
-                        print(
-                            f"    detection[{schema.detection_index}] ({schema.label}): confidence={schema.detection_confidence:.2f}"
-                        )
-            else:
-                print("    No target detections to caption.")
-
-        if args.show:
-            display_image(output_path)
+    options = dict(
+        mgrs=args.mgrs,
+        sensor_id=args.sensor_id,
+        observer_signature=args.observer_signature,
+        weights=args.weights,
+        caption_model=args.caption_model,
+        confidence=args.confidence,
+        caption=args.caption,
+        device=device,
+        caption_corpus=args.caption_corpus,
+        caption_top_k=args.caption_top_k,
+    )
+
+    paths = iter(image_paths)
+    while batch := list(islice(paths, args.batch_size)):
+        # Detection runs once per chunk; annotation and file IO stay per image below.
+        outputs = Yolov8PersonCaptionSchema.analyze_images(batch, batch_size=len(batch), **options)
+        for image_path, (readings, schemas, result) in zip(batch, outputs):
+            all_readings.extend(readings)
+
+            if result is None:
+                print(f"{image_path.name}: No results returned by the model.")
+                continue
+
+            summarize_result(result, image_path)
+            output_path = annotate_and_save(result, image_path, args.output_dir)
+            print(f"  ↳ Saved annotated image to {output_path}")
+
+            if args.caption:
+                if schemas:
+                    for schema in schemas:
+                        if schema.caption:
+                            print(
+                                f"    caption[{schema.detection_index}] ({schema.label}): {schema.caption}"
+                            )
+                        else:
+                            print(
+                                f"    detection[{schema.detection_index}] ({schema.label}): confidence={schema.detection_confidence:.2f}"
+                            )
+                else:
+                    print("    No target detections to caption.")
+
+            if args.show:
+                display_image(output_path)
 
     print("\nInference complete.")
     if not args.show:
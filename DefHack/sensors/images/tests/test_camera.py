@@ -0,0 +1,72 @@
+import os
+import re
+import threading
+import time
+
+from DefHack.sensors.images.camera import CameraWorker, rotate_and_save
+
+
+def test_rotate_and_save_keeps_newest_captures(tmp_path):
+    folder = tmp_path / "current_image"
+    folder.mkdir()
+    old = time.time() - 3600
+    legacy = [folder / "image_0_20240101-000000.jpg", folder / "image_1_20240101-000010.jpg"]
+    untouched = [folder / "notes.txt", folder / "snapshot.jpg", folder / "image_temp.jpg"]
+    for path in legacy + untouched:
+        path.write_bytes(b"old")
+        os.utime(path, (old, old))
+
+    staging = tmp_path / "staging.jpg"
+    for index in range(5):
+        staging.write_bytes(f"frame-{index}".encode())
+        rotate_and_save(str(folder), str(staging), keep=3)
+        time.sleep(0.01)  # distinct millisecond timestamps and mtimes
+
+    assert not staging.exists()
+    for path in untouched:
+        assert path.read_bytes() == b"old"
+    for path in legacy:
+        assert not path.exists()
+
+    captures = sorted(p for p in folder.iterdir() if p not in untouched)
+    assert len(captures) == 3
+    assert all(re.fullmatch(r"image_\d{8}-\d{6}-\d{3}\.jpg", p.name) for p in captures)
+    assert [p.read_bytes() for p in captures] == [b"frame-2", b"frame-3", b"frame-4"]
+
+
+class _SlowCapture:
+    """Fake capture whose grab() blocks for a long exposure."""
+
+    def __init__(self):
+        self.grabbing = threading.Event()
+
+    def grab(self):
+        self.grabbing.set()
+        time.sleep(0.3)
+        return True
+
+    def retrieve(self):
+        return True, "frame"
+
+    def release(self):
+        pass
+
+
+def test_get_latest_frame_timeout_covers_busy_capture(monkeypatch):
+    capture = _SlowCapture()
+    camera = CameraWorker(src=0)
+    monkeypatch.setattr(camera, "_open_capture", lambda: capture)
+    camera.start()
+    try:
+        assert camera.get_latest_frame(timeout=2.0) == "frame"
+        capture.grabbing.clear()
+        assert capture.grabbing.wait(2.0)
+        # A grab now holds the capture; waiting for it must not outlast the timeout.
+        camera._new_frame.set()
+        started = time.monotonic()
+        assert camera.get_latest_frame(timeout=0.1) is None
+        assert time.monotonic() - started < 0.2
+        # Once that grab finishes, the waiting consumer goes before the next one.
+        assert camera.get_latest_frame(timeout=2.0) == "frame"
+    finally:
+        camera.stop()
@@ -125,4 +125,54 @@ def test_yolov8_pipeline_generates_sensor_readings(monkeypatch, dummy_image_path
     assert conf == 0.5
     assert verbose is False
     assert save is False
-    assert device in {"cpu", "cuda"}
\ No newline at end of file
+    assert device in {"cpu", "cuda"}
+
+
+class DummyBatchModel:
+    def __init__(self, results):
+        self._results = list(results)
+        self.predict_calls = []
+
+    def predict(self, *, source, conf, verbose, save, device, batch):
+        self.predict_calls.append((list(source), batch))
+        taken, self._results = self._results[: len(source)], self._results[len(source):]
+        return taken
+
+
+def test_yolov8_pipeline_analyze_images_batches_predictions(monkeypatch, tmp_path):
+    image = np.zeros((64, 64, 3), dtype=np.uint8)
+    paths = []
+    results = []
+    for index in range(3):
+        path = tmp_path / f"synthetic_{index}.jpg"
+        Image.fromarray(image).save(path)
+        paths.append(path)
+        boxes = DummyBoxes(
+            cls_tensor=torch.tensor([0.0] * (index + 1)),
+            conf_tensor=torch.tensor([0.9] * (index + 1)),
+            xyxy_tensor=torch.tensor([[5.0, 5.0, 40.0, 40.0]] * (index + 1)),
+        )
+        results.append(DummyResult(boxes=boxes, names={0: "person"}, image=image))
+
+    model = DummyBatchModel(results)
+    monkeypatch.setattr(PIPELINE_MODULE, "_load_yolo_model", lambda weights, device: model)
+
+    outputs = Yolov8PersonCaptionSchema.analyze_images(
+        paths,
+        batch_size=2,
+        weights="dummy.pt",
+        confidence=0.5,
+        caption=False,
+    )
+
+    assert [batch for _, batch in model.predict_calls] == [2, 1]
+    assert [source for source, _ in model.predict_calls] == [
+        [str(paths[0]), str(paths[1])],
+        [str(paths[2])],
+    ]
+    assert len(outputs) == 3
+    for index, (readings, schemas, raw_result) in enumerate(outputs):
+        assert len(schemas) == index + 1
+        assert all(schema.image_path == paths[index] for schema in schemas)
+        assert readings[0].amount == float(index + 1)
+        assert raw_result is results[index]
@@ -161,21 +161,25 @@ def _collect_target_detections(result, confidence_threshold: float) -> List[Tupl
         return []
 
     names = result.names
-    detections: List[Tuple[List[float], float, str, int]] = []
-
-    for idx, (cls_val, conf_val) in enumerate(zip(boxes.cls.tolist(), boxes.conf.tolist())):
-        cls_id = int(cls_val)
-        label = None
-        if isinstance(names, dict):
-            label = names.get(cls_id)
-        elif isinstance(names, list) and 0 <= cls_id < len(names):
-            label = names[cls_id]
-        if label not in TARGET_LABELS or conf_val < confidence_threshold:
-            continue
-        bbox = boxes.xyxy[idx].cpu().tolist()
-        detections.append((bbox, float(conf_val), label, cls_id))
+    # One host transfer per tensor instead of a device sync per kept box.
+    classes = boxes.cls.tolist()
+    confidences = boxes.conf.tolist()
+    xyxy = boxes.xyxy.cpu().tolist()
+    labels = {cls_id: _label_for(names, cls_id) for cls_id in set(map(int, classes))}
+
+    return [
+        (bbox, float(conf_val), labels[int(cls_val)], int(cls_val))
+        for cls_val, conf_val, bbox in zip(classes, confidences, xyxy)
+        if conf_val >= confidence_threshold and labels[int(cls_val)] in TARGET_LABELS
+    ]
+
 
-    return detections
+def _label_for(names, cls_id: int) -> Optional[str]:
+    if isinstance(names, dict):
+        return names.get(cls_id)
+    if isinstance(names, list) and 0 <= cls_id < len(names):
+        return names[cls_id]
+    return None
 
 
 def _filter_result_to_targets(result) -> None:
@@ -184,25 +188,19 @@ def _filter_result_to_targets(result) -> None:
         return
 
     names = result.names
-    keep_mask: List[bool] = []
-    for cls_val in boxes.cls.tolist():
-        cls_idx = int(cls_val)
-        label = None
-        if isinstance(names, dict):
-            label = names.get(cls_idx)
-        elif isinstance(names, list) and 0 <= cls_idx < len(names):
-            label = names[cls_idx]
-        if label in TARGET_LABELS:
-            keep_mask.append(True)
-        else:
-            keep_mask.append(False)
-
-    if not any(keep_mask):
-        result.boxes = boxes[torch.zeros_like(boxes.cls, dtype=torch.bool)]
-        return
-
-    mask_tensor = torch.tensor(keep_mask, device=boxes.cls.device, dtype=torch.bool)
-    result.boxes = boxes[mask_tensor]
+    if isinstance(names, dict):
+        items = names.items()
+    elif isinstance(names, list):
+        items = enumerate(names)
+    else:
+        items = ()
+    # Match class ids on-device in one pass rather than building a Python mask per box.
+    target_ids = torch.tensor(
+        [cls_id for cls_id, label in items if label in TARGET_LABELS],
+        dtype=boxes.cls.dtype,
+        device=boxes.cls.device,
+    )
+    result.boxes = boxes[torch.isin(boxes.cls, target_ids)]
 
 
 def _extract_detection_crops(result, detections: Sequence[Tuple[List[float], float, str, int]]) -> List[Image.Image]:
@@ -249,18 +247,21 @@ def _get_corpus_embeddings(
         return [], None
 
     path = Path(corpus_path)
-    if not path.exists():
-        return [], None
-
-    lines = _load_corpus(path)
-    if not lines:
+    try:
+        stamp = path.stat().st_mtime
+    except OSError:
         return [], None
 
-    stamp = path.stat().st_mtime
+    # Check the cache before touching the file so repeated calls cost one stat.
     cache_key = (str(path.resolve()), stamp, model_id, device)
     if cache_key in _CORPUS_CACHE:
         return _CORPUS_CACHE[cache_key]
 
+    lines = _load_corpus(path)
+    if not lines:
+        _CORPUS_CACHE[cache_key] = ([], None)
+        return _CORPUS_CACHE[cache_key]
+
     with torch.no_grad():
         text_tokens = tokenizer(lines)
         text_tokens = text_tokens.to(device)
@@ -318,13 +319,11 @@ def _retrieve_captions(
     k = max(1, min(top_k, similarities.shape[1]))
     top_scores, top_indices = similarities.topk(k, dim=-1)
 
-    for idx in range(len(crops)):
-        phrases = []
-        for rank in range(k):
-            text_idx = top_indices[idx, rank].item()
-            score = top_scores[idx, rank].item()
-            phrases.append(f"{corpus_lines[text_idx]} ({score:.2f})")
-        captions.append("; ".join(phrases))
+    # Two host transfers for the whole batch instead of two .item() syncs per rank.
+    for row_scores, row_indices in zip(top_scores.tolist(), top_indices.tolist()):
+        captions.append(
+            "; ".join(f"{corpus_lines[text_idx]} ({score:.2f})" for text_idx, score in zip(row_indices, row_scores))
+        )
 
     return captions
 
@@ -433,15 +432,7 @@ class Yolov8PersonCaptionSchema(SensorSchema):
         downstream visualisation (annotation, plotting, etc.).
         """
 
-        overrides = _settings_overrides()
-        if weights == cls.DEFAULT_WEIGHTS and "weights" in overrides:
-            weights = overrides["weights"]
-        if caption_model == cls.DEFAULT_CAPTION_MODEL and "caption_model" in overrides:
-            caption_model = overrides["caption_model"]
-        if device is None and "device" in overrides:
-            device = overrides["device"]
-
-        resolved_device = _resolve_device(device)
+        weights, caption_model, resolved_device = cls._resolve_runtime(weights, caption_model, device)
         model = _load_yolo_model(weights, resolved_device)
 
         results = model.predict(
@@ -454,7 +445,148 @@ class Yolov8PersonCaptionSchema(SensorSchema):
         if not results:
             return [], [], None
 
-        result = results[0]
+        return cls._outputs_from_result(
+            results[0],
+            image_path,
+            mgrs=mgrs,
+            sensor_id=sensor_id,
+            observer_signature=observer_signature,
+            weights=weights,
+            caption_model=caption_model,
+            confidence=confidence,
+            caption=caption,
+            device=resolved_device,
+            caption_corpus=caption_corpus,
+            caption_top_k=caption_top_k,
+        )
+
+    @classmethod
+    def analyze_images(
+        cls,
+        image_paths: Sequence[Path],
+        *,
+        batch_size: int = 8,
+        mgrs: str = "UNKNOWN",
+        sensor_id: str = "YOLOv8-Pipeline",
+        observer_signature: str = "YOLOv8 Inference",
+        weights: str = DEFAULT_WEIGHTS,
+        caption_model: str = DEFAULT_CAPTION_MODEL,
+        confidence: float = 0.25,
+        caption: bool = True,
+        device: Optional[str] = None,
+        caption_corpus: Optional[Path] = Path("src/bag_of_words.txt"),
+        caption_top_k: int = 1,
+    ) -> List[Tuple[List[SensorObservationIn], List["Yolov8PersonCaptionSchema"], Optional[object]]]:
+        """Batched :meth:`analyze_image` returning one output tuple per path, in order.
+
+        The detector sees ``batch_size`` images per forward pass instead of one,
+        so preprocessing, host-to-device copies and kernel launches are amortised
+        across the batch.
+        """
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        paths = [Path(path) for path in image_paths]
+        if not paths:
+            return []
+
+        weights, caption_model, resolved_device = cls._resolve_runtime(weights, caption_model, device)
+        model = _load_yolo_model(weights, resolved_device)
+
+        outputs: List[Tuple[List[SensorObservationIn], List[Yolov8PersonCaptionSchema], Optional[object]]] = []
+        for start in range(0, len(paths), batch_size):
+            batch = paths[start:start + batch_size]
+            results = model.predict(
+                source=[str(path) for path in batch],
+                conf=confidence,
+                verbose=False,
+                save=False,
+                device=resolved_device,
+                batch=len(batch),
+            )
+            results = list(results or [])
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"Detector returned {len(results)} result(s) for a batch of {len(batch)} image(s)"
+                )
+            for image_path, result in zip(batch, results):
+                outputs.append(
+                    cls._outputs_from_result(
+                        result,
+                        image_path,
+                        mgrs=mgrs,
+                        sensor_id=sensor_id,
+                        observer_signature=observer_signature,
+                        weights=weights,
+                        caption_model=caption_model,
+                        confidence=confidence,
+                        caption=caption,
+                        device=resolved_device,
+                        caption_corpus=caption_corpus,
+                        caption_top_k=caption_top_k,
+                    )
+                )
+        return outputs
+
+    @classmethod
+    def warm_up(
+        cls,
+        *,
+        weights: str = DEFAULT_WEIGHTS,
+        caption_model: str = DEFAULT_CAPTION_MODEL,
+        caption: bool = True,
+        device: Optional[str] = None,
+        caption_corpus: Optional[Path] = Path("src/bag_of_words.txt"),
+    ) -> None:
+        """Load the detector (and caption model plus corpus embeddings) into the caches.
+
+        Later :meth:`analyze_image`/:meth:`analyze_images` calls with the same
+        settings then only pay for inference.
+        """
+
+        weights, caption_model, resolved_device = cls._resolve_runtime(weights, caption_model, device)
+        _load_yolo_model(weights, resolved_device)
+        if caption:
+            clip_model, _preprocess, tokenizer, _dtype = _get_clip_components(caption_model, resolved_device)
+            _get_corpus_embeddings(
+                caption_corpus,
+                model_id=caption_model,
+                device=resolved_device,
+                tokenizer=tokenizer,
+                model=clip_model,
+            )
+
+    @classmethod
+    def _resolve_runtime(
+        cls, weights: str, caption_model: str, device: Optional[str]
+    ) -> Tuple[str, str, str]:
+        overrides = _settings_overrides()
+        if weights == cls.DEFAULT_WEIGHTS and "weights" in overrides:
+            weights = overrides["weights"]
+        if caption_model == cls.DEFAULT_CAPTION_MODEL and "caption_model" in overrides:
+            caption_model = overrides["caption_model"]
+        if device is None and "device" in overrides:
+            device = overrides["device"]
+        return weights, caption_model, _resolve_device(device)
+
+    @classmethod
+    def _outputs_from_result(
+        cls,
+        result,
+        image_path: Path,
+        *,
+        mgrs: str,
+        sensor_id: str,
+        observer_signature: str,
+        weights: str,
+        caption_model: str,
+        confidence: float,
+        caption: bool,
+        device: str,
+        caption_corpus: Optional[Path],
+        caption_top_k: int,
+    ) -> Tuple[List[SensorObservationIn], List["Yolov8PersonCaptionSchema"], Optional[object]]:
         detections = _collect_target_detections(result, confidence_threshold=confidence)
 
         crops = _extract_detection_crops(result, detections) if caption else []
@@ -465,7 +597,7 @@ class Yolov8PersonCaptionSchema(SensorSchema):
                     crops,
                     detections,
                     model_id=caption_model,
-                    device=resolved_device,
+                    device=device,
                     corpus_path=caption_corpus,
                     top_k=caption_top_k,
                 )
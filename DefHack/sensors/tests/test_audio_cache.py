@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import pytest
+
+from DefHack.sensors.audio import _cache
+from DefHack.sensors.audio._cache import DiskCache
+
+
+def test_disk_cache_round_trip(tmp_path) -> None:
+    cache = DiskCache(tmp_path)
+    cache.set("spectrum", ("a.wav", 1), [1.0, 2.0])
+
+    assert cache.get("spectrum", ("a.wav", 1)) == [1.0, 2.0]
+    assert cache.get("spectrum", ("b.wav", 1), "miss") == "miss"
+
+
+@pytest.mark.parametrize("error", [OSError("disk full"), RuntimeError("boom")])
+def test_failed_cache_write_leaves_no_temp_file(tmp_path, monkeypatch, error) -> None:
+    def failing_replace(src, dst):
+        raise error
+
+    monkeypatch.setattr(_cache.os, "replace", failing_replace)
+    cache = DiskCache(tmp_path)
+    if isinstance(error, OSError):
+        cache.set("spectrum", ("a.wav", 1), [1.0])
+    else:
+        with pytest.raises(RuntimeError):
+            cache.set("spectrum", ("a.wav", 1), [1.0])
+
+    assert not list(tmp_path.rglob("*.tmp"))
+    assert cache.get("spectrum", ("a.wav", 1)) is None
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import os
+import time
+
 import numpy as np
+import pytest
 
 from DefHack.sensors.SensorSchema import SensorSchema
-from DefHack.sensors.audio import analyze_audio
-from DefHack.sensors.audio.models import blade_pass_frequency
+from DefHack.sensors.audio import Detector, analyze_audio, flush_reports, load_config
+from DefHack.sensors.audio.analysis import amplitude_to_db, compute_fft, reduce_spectrum
+from DefHack.sensors.audio.analysis import bpf_detection
+from DefHack.sensors.audio.models import RotorSpecification, blade_pass_frequency, simulate_rotor_noise
 from DefHack.sensors.audio.schemas import AcousticDroneSchema
+from DefHack.sensors.audio.utils import load_wav, map_wav, write_wav
 
 
 def test_simulated_rotor_detection() -> None:
@@ -44,3 +51,147 @@ def test_silence_returns_no_detection() -> None:
     assert schema.metadata.get("confidence_pct") == 0
     observation = schema.to_sensor_message()
     assert "no rotor" in observation.what.lower()
+
+
+def test_config_cached_spectrum_matches_explicit_fft() -> None:
+    config = load_config()
+    rng = np.random.default_rng(7)
+    signal = rng.standard_normal(3_000).astype(np.float32)
+
+    freq_cached, mag_cached = compute_fft(signal, config.sampling_rate, config=config)
+    freq_plain, mag_plain = compute_fft(
+        signal,
+        config.sampling_rate,
+        fft_size=config.fft_size,
+        window=config.window,
+    )
+
+    assert np.allclose(freq_cached, freq_plain)
+    assert np.allclose(mag_cached, mag_plain)
+    roi = freq_cached[config.roi_slice]
+    assert roi[0] >= config.min_bpf_hz and roi[-1] <= config.max_bpf_hz
+
+
+def test_detector_reuse_matches_analyze_audio() -> None:
+    detector = Detector(load_config())
+    rng = np.random.default_rng(11)
+    signals = [rng.standard_normal(4_096).astype(np.float32) for _ in range(3)]
+
+    for signal in signals:
+        reused = detector.analyze(signal, sample_rate=44_100)
+        fresh = analyze_audio(signal, sample_rate=44_100)
+        assert reused.metadata["fundamental_hz"] == fresh.metadata["fundamental_hz"]
+        assert reused.metadata["confidence_pct"] == fresh.metadata["confidence_pct"]
+        assert reused.metadata["config"] == fresh.metadata["config"]
+
+
+def test_mapped_wav_round_trip(tmp_path) -> None:
+    rng = np.random.default_rng(5)
+    signal = np.clip(rng.standard_normal(50_000) * 0.3, -1.0, 1.0).astype(np.float32)
+    path = tmp_path / "tone.wav"
+    write_wav(path, 16_000, signal)
+
+    sample_rate, pcm = map_wav(path)
+    assert sample_rate == 16_000.0
+    assert pcm.shape == (signal.size, 1) and not pcm.flags.writeable
+
+    loaded_rate, loaded = load_wav(path)
+    assert loaded_rate == sample_rate
+    assert loaded.dtype == np.float32
+    assert np.array_equal(loaded, (pcm[:, 0] / np.float32(32_767.0)).astype(np.float32))
+    assert np.allclose(loaded, signal, atol=1.0 / 32_767.0)
+
+
+def test_simulated_noise_is_reproducible_with_seed() -> None:
+    config = load_config()
+    spec = RotorSpecification(rpm=4_200, blades=4, radius_m=0.165)
+    _, first, _ = simulate_rotor_noise(0.5, config, spec=spec, rng=7)
+    _, second, _ = simulate_rotor_noise(0.5, config, spec=spec, rng=np.random.default_rng(7))
+    _, unseeded, _ = simulate_rotor_noise(0.5, config, spec=spec)
+
+    np.testing.assert_array_equal(first, second)
+    assert not np.array_equal(first, unseeded)
+
+
+def test_load_config_unknown_override_raises_once() -> None:
+    with pytest.raises(TypeError, match="bogus") as excinfo:
+        load_config(overrides={"bogus": 1})
+    assert excinfo.value.__context__ is None
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_reports_are_written_after_fork(tmp_path) -> None:
+    silence = np.zeros(4_096, dtype=np.float32)
+    parent_report = tmp_path / "parent.txt"
+    child_report = tmp_path / "child.txt"
+    # Leave the parent's writer thread running across the fork.
+    analyze_audio(silence, sample_rate=16_000, save_report=True, report_path=parent_report)
+    deadline = time.monotonic() + 5.0
+    while not parent_report.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert parent_report.exists()
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - child process
+        status = 1
+        try:
+            analyze_audio(silence, sample_rate=16_000, save_report=True, report_path=child_report)
+            flush_reports(raise_errors=True)
+            status = 0 if child_report.exists() else 1
+        finally:
+            os._exit(status)
+    _, status = os.waitpid(pid, 0)
+    flush_reports()
+
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert child_report.exists()
+
+
+def test_amplitude_to_db_accepts_scalars_and_arrays() -> None:
+    assert np.isclose(amplitude_to_db(0.5), 20.0 * np.log10(0.5))
+    assert amplitude_to_db(0.0) == -120.0
+
+    values = np.array([1.0, 0.5, 0.0], dtype=np.float32)
+    db = amplitude_to_db(values)
+    assert db.dtype == np.float32
+    assert np.allclose(db, [0.0, 20.0 * np.log10(0.5), -120.0])
+
+
+def _tone_spectra():
+    config = load_config()
+    rng = np.random.default_rng(13)
+    t = np.arange(config.fft_size) / config.sampling_rate
+    for fundamental in (None, 90.0, 240.0, 615.0, 1_480.0):
+        for noise in (0.01, 0.2, 1.0):
+            signal = noise * rng.standard_normal(t.size)
+            if fundamental is not None:
+                signal += sum(
+                    (0.5 / order) * np.sin(2 * np.pi * fundamental * order * t) for order in range(1, 5)
+                )
+            _, magnitude = compute_fft(signal.astype(np.float32), config.sampling_rate, config=config)
+            f_roi = config.freq_bins[config.roi_slice]
+            db_roi = amplitude_to_db(magnitude[config.roi_slice])
+            _, noise_floor = reduce_spectrum(db_roi)
+            yield f_roi, db_roi, noise_floor
+
+
+@pytest.mark.parametrize(
+    "resolve_core",
+    [
+        pytest.param(lambda: bpf_detection._detect_bpf_kernel, id="python-kernel"),
+        pytest.param(bpf_detection._resolve_core, id="resolved-core"),
+    ],
+)
+@pytest.mark.parametrize("prominence_ratio", [3.0, 6.0, 12.0])
+def test_bpf_cores_match_numpy_detector(resolve_core, prominence_ratio) -> None:
+    core = resolve_core()
+    for f_roi, db_roi, noise_floor in _tone_spectra():
+        expected = bpf_detection._detect_bpf_numpy(f_roi, db_roi, prominence_ratio, 6, noise_floor)
+        actual = core(f_roi, db_roi, prominence_ratio, 6, noise_floor)
+
+        status, n_harm = expected[0], expected[7]
+        assert (actual[0], actual[7]) == (status, n_harm)
+        assert np.allclose(actual[1:4], expected[1:4])
+        assert np.array_equal(actual[4][:n_harm], expected[4][:n_harm])
+        assert np.allclose(actual[5][:n_harm], expected[5][:n_harm])
+        assert np.allclose(actual[6][:n_harm], expected[6][:n_harm])
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+
+from DefHack.sensors.audio import pipeline
+from DefHack.sensors.audio._cache import CACHE_DIR_ENV
+from DefHack.sensors.audio.parameter_sweep import build_parser, run_sweep
+from DefHack.sensors.audio.utils import write_wav
+
+
+def _write_dataset(root, count: int) -> None:
+    rng = np.random.default_rng(3)
+    folder = root / "drone" / "cfg" / "mission"
+    folder.mkdir(parents=True)
+    for index in range(count):
+        t = np.arange(8_000) / 16_000.0
+        tone = 0.4 * np.sin(2 * np.pi * (200.0 + 40.0 * index) * t)
+        signal = tone + 0.05 * rng.standard_normal(t.size)
+        write_wav(folder / f"clip_{index}.wav", 16_000, signal.astype(np.float32))
+
+
+def test_second_combo_reuses_cached_spectra(tmp_path, monkeypatch) -> None:
+    positive = tmp_path / "positive"
+    negative = tmp_path / "negative"
+    _write_dataset(positive, 5)
+    _write_dataset(negative, 2)
+    cache_dir = tmp_path / "cache"
+    monkeypatch.delenv(CACHE_DIR_ENV, raising=False)
+
+    decoded = []
+    real_load_wav = pipeline.load_wav
+
+    def counting_load_wav(source):
+        decoded.append(source)
+        return real_load_wav(source)
+
+    monkeypatch.setattr(pipeline, "load_wav", counting_load_wav)
+
+    read = []
+    real_read_bytes = Path.read_bytes
+
+    def counting_read_bytes(path):
+        if path.suffix == ".wav":
+            read.append(path)
+        return real_read_bytes(path)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+
+    args = build_parser().parse_args(
+        [
+            "--positive-root", str(positive),
+            "--negative-root", str(negative),
+            "--prominence-ratio", "6", "8",
+            "--min-bpf", "--max-bpf", "--harmonics", "--noise-floor",
+            "--jobs", "1",
+            "--cache-dir", str(cache_dir),
+            "--quiet",
+        ]
+    )
+    rows = run_sweep(args)
+
+    assert [row["prominence_ratio"] for row in rows] == [6.0, 8.0]
+    assert all(row["positive_total_files"] == 5 for row in rows)
+    # Only the first combo reads and decodes; the second is served from the spectrum cache.
+    assert len(decoded) == 7
+    assert len(read) == 7
+    assert any(cache_dir.rglob("*.pkl.*"))